@@ -0,0 +1,22 @@
+"""Entry point for the `sudosu` command and `python -m sudosu`."""
+
+import sys
+
+
+def main():
+    """Run the Sudosu CLI.
+    
+    `sudosu --version` is answered here, before sudosu.cli (and with it Typer,
+    Rich, prompt_toolkit, websockets, ...) is imported.
+    """
+    if len(sys.argv) == 2 and sys.argv[1] in ("-v", "--version"):
+        from sudosu import __version__
+        print(f"sudosu version {__version__}")
+        return
+    
+    from sudosu.cli import app
+    app()
+
+
+if __name__ == "__main__":
+    main()
@@ -9,10 +9,16 @@ from typing import Optional
 
 import typer
 
-from sudosu.commands.agent import get_agent_config, get_available_agents, handle_agent_command
+from sudosu.commands.agent import (
+    get_agent_config,
+    get_available_agents,
+    get_available_agents_text,
+    handle_agent_command,
+)
 from sudosu.commands.config import handle_config_command
 from sudosu.commands.init import init_command, init_project_command
 from sudosu.commands.integrations import (
+    close_http_client,
     get_user_id,
     handle_connect_command,
     handle_disconnect_command,
@@ -25,7 +31,14 @@ from sudosu.commands.onboarding import (
     handle_profile_command,
 )
 from sudosu.commands.tasks import handle_tasks_command, app as tasks_app
-from sudosu.core import ensure_config_structure, ensure_project_structure, get_backend_url, get_global_config_dir
+from sudosu.core import (
+    ensure_config_structure,
+    ensure_project_structure,
+    get_backend_url,
+    get_config_value,
+    get_global_config_dir,
+)
+from sudosu.core.aio import run_async
 from sudosu.core.connection import ConnectionManager
 from sudosu.core.default_agent import get_default_agent_config, load_default_agent_from_file
 from sudosu.core.safety import is_safe_directory, get_safety_warning
@@ -53,6 +66,20 @@ from sudosu.ui import (
     COLOR_ACCENT,
 )
 
+# Pattern for "@agent_name message" prompts, compiled once at import
+_AGENT_PROMPT_RE = re.compile(r"@(\w+)\s*(.*)", re.DOTALL)
+
+# Backend connection shared by every turn of the session
+_manager: Optional[ConnectionManager] = None
+
+# Upper bound on agent streams running at once (see _get_agent_semaphore).
+# Streams that don't bring their own manager share the single _manager
+# WebSocket, which can only carry one agent stream at a time, so the default
+# is 1; raise it only for callers that give each stream its own connection.
+DEFAULT_MAX_CONCURRENT_AGENTS = 1
+# (limit it was sized for, semaphore)
+_agent_semaphore: Optional[tuple[int, asyncio.Semaphore]] = None
+
 app = typer.Typer(
     name="sudosu",
     help="Your AI Coworker Platform — AI teammates that actually get work done",
@@ -92,7 +119,7 @@ def main_callback(
         return
     
     if init:
-        asyncio.run(init_command(silent=False))
+        run_async(init_command(silent=False))
         return
     
     # Interactive mode (default)
@@ -106,22 +133,112 @@ def parse_agent_prompt(text: str) -> tuple[str, str]:
     Returns:
         Tuple of (agent_name, message)
     """
-    match = re.match(r"@(\w+)\s*(.*)", text, re.DOTALL)
+    if not text.startswith("@"):
+        return "", text
+    
+    match = _AGENT_PROMPT_RE.match(text)
     if match:
         return match.group(1), match.group(2).strip()
     return "", text
 
 
-async def stream_agent_response(agent_config: dict, message: str, cwd: str, agent_name: str = "agent") -> dict | None:
+async def get_connection(backend_url: str) -> ConnectionManager:
+    """Get the session's backend connection, connecting on first use.
+    
+    The WebSocket is kept open between messages so follow-ups and routed
+    hand-offs don't pay a new TCP + TLS + WebSocket handshake each time.
+    """
+    global _manager
+    if _manager is not None and _manager.backend_url != backend_url:
+        # Backend changed (e.g. /config mode) - drop the old connection
+        await close_connection()
+    if _manager is None:
+        _manager = ConnectionManager(backend_url)
+    await _manager.ensure_connected()
+    return _manager
+
+
+async def close_connection():
+    """Close the session's backend connection, if any."""
+    global _manager
+    if _manager is not None:
+        manager, _manager = _manager, None
+        try:
+            await manager.disconnect()
+        except Exception:
+            pass
+
+
+def _get_agent_semaphore() -> asyncio.Semaphore:
+    """Get the semaphore bounding concurrent agent invocations.
+    
+    The max_concurrent_agents config key is read on every call, so
+    `/config set max_concurrent_agents` takes effect for the next stream;
+    streams already running keep the slot they acquired.
+    """
+    global _agent_semaphore
+    try:
+        limit = int(get_config_value("max_concurrent_agents") or DEFAULT_MAX_CONCURRENT_AGENTS)
+    except (TypeError, ValueError):
+        limit = DEFAULT_MAX_CONCURRENT_AGENTS
+    limit = max(limit, 1)
+    if _agent_semaphore is None or _agent_semaphore[0] != limit:
+        _agent_semaphore = (limit, asyncio.Semaphore(limit))
+    return _agent_semaphore[1]
+
+
+async def connect_backend() -> Optional[ConnectionManager]:
+    """Get the backend connection, printing a hint if it can't be reached.
+    
+    Returns:
+        Connected ConnectionManager, or None if connecting failed
+    """
+    backend_url = get_backend_url()
+    try:
+        return await get_connection(backend_url)
+    except Exception as e:
+        print_error(f"Failed to connect to backend: {e}")
+        print_info("Make sure the backend is running")
+        print_info(f"Backend URL: {backend_url}")
+        return None
+
+
+async def stream_agent_response(
+    agent_config: dict,
+    message: str,
+    cwd: str,
+    agent_name: str = "agent",
+    manager: Optional[ConnectionManager] = None,
+) -> dict | None:
     """
     Common function to stream agent response from backend with SHARED thread memory.
     
     All agents use the same thread_id to share conversation context.
     
+    Concurrent calls are capped by the max_concurrent_agents config key
+    (default 1). Raising it is only safe for callers that pass each stream
+    its own manager, since one WebSocket can't carry two interleaved agent
+    streams.
+    
+    Args:
+        manager: Already-connected backend connection to reuse (e.g. for the
+            second hop of a routed prompt); looked up when omitted
+    
     Returns:
         Routing info dict if agent called route_to_agent or consultation triggered routing, None otherwise
     """
-    backend_url = get_backend_url()
+    async with _get_agent_semaphore():
+        return await _stream_agent_response(agent_config, message, cwd, agent_name, manager)
+
+
+async def _stream_agent_response(
+    agent_config: dict,
+    message: str,
+    cwd: str,
+    agent_name: str,
+    manager: Optional[ConnectionManager],
+) -> dict | None:
+    """Body of stream_agent_response, run while holding a concurrency slot."""
     routing_info = None
     consultation_routing = None
     
@@ -138,14 +255,13 @@ async def stream_agent_response(agent_config: dict, message: str, cwd: str, agen
     # Increment message count
     session_mgr.increment_message_count()
     
-    try:
-        manager = ConnectionManager(backend_url)
-        await manager.connect()
-    except Exception as e:
-        print_error(f"Failed to connect to backend: {e}")
-        print_info("Make sure the backend is running")
-        print_info(f"Backend URL: {backend_url}")
-        return None
+    if manager is None or not manager.is_connected:
+        manager = await connect_backend()
+        if manager is None:
+            return None
+    
+    # Only a turn that ended with "done" leaves the socket in a known state
+    completed = False
     
     try:
         stream_printer = LiveStreamPrinter()
@@ -161,8 +277,9 @@ async def stream_agent_response(agent_config: dict, message: str, cwd: str, agen
             # Special handling for route_to_agent
             if tool_name == "route_to_agent":
                 result = await execute_tool(tool_name, args, cwd)
-                # Capture routing info for later
-                if result.get(ROUTING_MARKER):
+                # Capture routing info for later (the marker is only ever
+                # present on a successful route, so one membership test does)
+                if ROUTING_MARKER in result:
                     routing_info = {
                         "agent_name": result["agent_name"],
                         "message": result["message"],
@@ -174,13 +291,16 @@ async def stream_agent_response(agent_config: dict, message: str, cwd: str, agen
                 # Backend handles this, but we need to return something
                 return {"output": "Consultation in progress..."}
             
-            # Normal tool execution
+            # Normal tool execution (draw any throttled text first so the
+            # status line doesn't appear ahead of it)
+            stream_printer.show_pending()
             print_tool_execution(tool_name, args)
             result = await execute_tool(tool_name, args, cwd)
             print_tool_result(tool_name, result)
             return result
         
         def on_status(status: str):
+            stream_printer.show_pending()
             console.print(f"[dim]{status}[/dim]")
         
         async def on_special_message(msg: dict):
@@ -239,10 +359,13 @@ async def stream_agent_response(agent_config: dict, message: str, cwd: str, agen
                 break
             elif msg.get("type") == "done":
                 stream_printer.flush()
+                completed = True
                 break
         
     finally:
-        await manager.disconnect()
+        if not completed:
+            # Don't let a half-read stream leak into the next turn
+            await close_connection()
     
     # Check for consultation-triggered routing first
     if consultation_routing:
@@ -296,7 +419,10 @@ async def invoke_active_agent(message: str, cwd: str):
         return
     
     print_agent_thinking(agent_name)
-    result = await stream_agent_response(agent_config, message, cwd, agent_name)
+    manager = await connect_backend()
+    if manager is None:
+        return
+    result = await stream_agent_response(agent_config, message, cwd, agent_name, manager)
     
     # Handle consultation-triggered routing
     if result and result.get("type") == "consultation_route":
@@ -317,7 +443,7 @@ async def invoke_active_agent(message: str, cwd: str):
         if target_config:
             session_mgr.set_active_agent(target_agent, via_routing=True)
             print_agent_thinking(target_agent)
-            await stream_agent_response(target_config, user_request, cwd, target_agent)
+            await stream_agent_response(target_config, user_request, cwd, target_agent, manager)
         else:
             print_error(f"Agent '{target_agent}' not found")
             print_info("Available agents:")
@@ -349,11 +475,9 @@ async def invoke_default_agent(message: str, cwd: str):
         # or append at the end
         system_prompt = agent_config.get("system_prompt", "")
         
-        # Add available agents context
-        if available_agents:
-            agents_text = "\n## Available Agents in This Project\n\n"
-            for a in available_agents:
-                agents_text += f"- **@{a.get('name')}**: {a.get('description', 'No description')}\n"
+        # Add available agents context (pre-joined and cached with the registry)
+        agents_text = get_available_agents_text()
+        if agents_text:
             system_prompt = system_prompt + "\n" + agents_text
         
         # Add user context
@@ -369,7 +493,11 @@ async def invoke_default_agent(message: str, cwd: str):
         agent_config = get_default_agent_config(available_agents, cwd, user_profile)
     
     print_agent_thinking("sudosu")
-    routing_info = await stream_agent_response(agent_config, message, cwd, "sudosu")
+    # One connection lookup serves both the orchestrator and any routed hop
+    manager = await connect_backend()
+    if manager is None:
+        return
+    routing_info = await stream_agent_response(agent_config, message, cwd, "sudosu", manager)
     
     # Check if the default agent decided to route to another agent
     if routing_info:
@@ -387,7 +515,7 @@ async def invoke_default_agent(message: str, cwd: str):
             session_mgr.set_active_agent(target_agent_name, via_routing=True)
             
             print_agent_thinking(target_agent_name)
-            await stream_agent_response(target_config, routed_message, cwd, target_agent_name)
+            await stream_agent_response(target_config, routed_message, cwd, target_agent_name, manager)
         else:
             print_error(f"Agent '{target_agent_name}' not found")
             print_info("Available agents:")
@@ -398,39 +526,40 @@ async def invoke_default_agent(message: str, cwd: str):
 
 async def handle_command(command: str):
     """Handle slash commands."""
-    parts = command.split()
-    cmd = parts[0].lower()
-    args = parts[1:]
+    # Peel off the command name; the rest is only tokenized by handlers that need a list
+    parts = command.split(None, 1)
+    cmd = parts[0].lower() if parts else ""
+    rest = parts[1].strip() if len(parts) > 1 else ""
     
     if cmd == "/help":
         print_help()
     
     elif cmd == "/agent":
-        await handle_agent_command(args)
+        await handle_agent_command(rest.split())
     
     elif cmd == "/config":
-        await handle_config_command(args)
+        await handle_config_command(rest)
     
     elif cmd == "/memory":
-        await handle_memory_command(args)
+        await handle_memory_command(rest.split())
     
     elif cmd == "/connect":
-        await handle_connect_command(" ".join(args))
+        await handle_connect_command(rest)
     
     elif cmd == "/disconnect":
-        await handle_disconnect_command(" ".join(args))
+        await handle_disconnect_command(rest)
     
     elif cmd == "/integrations":
-        await handle_integrations_command(" ".join(args))
+        await handle_integrations_command(rest)
     
     elif cmd == "/profile":
-        await handle_profile_command(" ".join(args))
+        await handle_profile_command(rest)
     
     elif cmd == "/tasks":
-        handle_tasks_command(args)
+        handle_tasks_command(rest.split())
     
     elif cmd == "/init":
-        if args and args[0] == "project":
+        if rest.split()[:1] == ["project"]:
             init_project_command()
         else:
             await init_command()
@@ -502,48 +631,65 @@ async def interactive_session():
     # Get session manager for active agent tracking
     session_mgr = get_session_manager()
     
-    while True:
-        try:
-            # Show active agent in prompt
-            active = session_mgr.get_active_agent()
-            if active != "sudosu":
-                prompt = f"[@{active}] > "
-            else:
-                prompt = "> "
-            
-            user_input = (await get_user_input_async(prompt)).strip()
-            
-            if not user_input:
-                continue
+    try:
+        while True:
+            try:
+                # Show active agent in prompt
+                active = session_mgr.get_active_agent()
+                if active != "sudosu":
+                    prompt = f"[@{active}] > "
+                else:
+                    prompt = "> "
             
-            if user_input.startswith("/"):
-                await handle_command(user_input)
+                user_input = (await get_user_input_async(prompt)).strip()
             
-            elif user_input.startswith("@"):
-                # Check safety for @agent invocation
-                if not is_safe:
-                    print_error("Agent invocation disabled in unsafe directory")
-                    print_info("Navigate to a project folder to use agents")
+                if not user_input:
                     continue
-                # Explicit agent switch - user is taking control
-                await invoke_agent(user_input, cwd)
             
-            else:
-                # Plain text - route to active agent
-                active_agent = session_mgr.get_active_agent()
+                # Non-empty here, so both prefixes are a single char compare
+                first = user_input[0]
                 
-                if active_agent == "sudosu":
-                    # Use orchestrator - it may route to another agent
-                    await invoke_default_agent(user_input, cwd)
+                if first == "/":
+                    await handle_command(user_input)
+            
+                elif first == "@":
+                    # Check safety for @agent invocation
+                    if not is_safe:
+                        print_error("Agent invocation disabled in unsafe directory")
+                        print_info("Navigate to a project folder to use agents")
+                        continue
+                    # Explicit agent switch - user is taking control
+                    await invoke_agent(user_input, cwd)
+            
                 else:
-                    # Continue with the active sub-agent
-                    await invoke_active_agent(user_input, cwd)
+                    # Plain text - route to active agent
+                    active_agent = session_mgr.get_active_agent()
+                
+                    if active_agent == "sudosu":
+                        # Use orchestrator - it may route to another agent
+                        await invoke_default_agent(user_input, cwd)
+                    else:
+                        # Continue with the active sub-agent
+                        await invoke_active_agent(user_input, cwd)
                 
-        except KeyboardInterrupt:
-            console.print(f"\n[{COLOR_PRIMARY}]Goodbye! 👋[/{COLOR_PRIMARY}]")
-            break
-        except EOFError:
-            break
+            except KeyboardInterrupt:
+                console.print(f"\n[{COLOR_PRIMARY}]Goodbye! 👋[/{COLOR_PRIMARY}]")
+                break
+            except EOFError:
+                break
+    finally:
+        # Release the backend WebSocket and pooled HTTP connections
+        await close_connection()
+        await close_http_client()
+
+
+async def _invoke_agent_once(prompt: str, cwd: str):
+    """Invoke a single agent prompt and close the connection afterwards."""
+    try:
+        await invoke_agent(prompt, cwd)
+    finally:
+        await close_connection()
+        await close_http_client()
 
 
 def _run_main_logic(prompt: Optional[str]):
@@ -551,10 +697,10 @@ def _run_main_logic(prompt: Optional[str]):
     if prompt:
         # Direct invocation
         cwd = os.getcwd()
-        asyncio.run(invoke_agent(prompt, cwd))
+        run_async(_invoke_agent_once(prompt, cwd))
     else:
         # Interactive mode
-        asyncio.run(interactive_session())
+        run_async(interactive_session())
 
 
 if __name__ == "__main__":
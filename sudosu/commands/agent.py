@@ -4,9 +4,7 @@ import os
 from pathlib import Path
 from typing import Optional
 
-import httpx
-
-from sudosu.core import get_project_config_dir
+from sudosu.core import get_project_config_dir, reset_dir_cache
 from sudosu.core.agent_loader import (
     AGENT_TEMPLATES,
     create_agent_template,
@@ -56,6 +54,8 @@ async def refine_prompt_via_backend(
     if integrations is None:
         integrations = []
     
+    import httpx
+    
     try:
         async with httpx.AsyncClient(timeout=30.0) as client:
             response = await client.post(
@@ -98,15 +98,72 @@ def list_agents_command():
     print_agents(agents)
 
 
+# Agents discovered in the project, plus the pre-joined listing the default
+# agent's prompt embeds: (stamp, agents, listing). The stamp covers the agents
+# directory and each AGENT.md mtime, so a cache hit costs one scandir and a
+# stat per agent instead of re-parsing every AGENT.md on each turn.
+_REGISTRY_CACHE: Optional[tuple[tuple, list[dict], str]] = None
+
+
+def invalidate_agents_cache() -> None:
+    """Forget the cached agent registry (after creating/deleting an agent)."""
+    global _REGISTRY_CACHE
+    _REGISTRY_CACHE = None
+
+
+def _registry_stamp(agents_dir: str) -> Optional[tuple]:
+    """Fingerprint the agents directory, or None if it doesn't exist."""
+    try:
+        dir_mtime = os.stat(agents_dir).st_mtime_ns
+        with os.scandir(agents_dir) as entries:
+            names = sorted(e.name for e in entries if e.is_dir())
+    except OSError:
+        return None
+    
+    agent_mtimes = []
+    for name in names:
+        try:
+            agent_mtimes.append((name, os.stat(os.path.join(agents_dir, name, "AGENT.md")).st_mtime_ns))
+        except OSError:
+            continue
+    return (agents_dir, dir_mtime, tuple(agent_mtimes))
+
+
+def _format_agents_listing(agents: list[dict]) -> str:
+    """Build the "Available Agents" section appended to a custom AGENT.md prompt."""
+    if not agents:
+        return ""
+    lines = [f"- **@{a.get('name')}**: {a.get('description', 'No description')}\n" for a in agents]
+    return "\n## Available Agents in This Project\n\n" + "".join(lines)
+
+
+def _get_registry() -> tuple[list[dict], str]:
+    """Return (agents, listing) for the current project, rebuilding on change."""
+    global _REGISTRY_CACHE
+    project_dir = get_project_config_dir()
+    if not project_dir:
+        return [], ""
+    
+    stamp = _registry_stamp(os.path.join(project_dir, "agents"))
+    if stamp is None:
+        return [], ""
+    if _REGISTRY_CACHE is not None and _REGISTRY_CACHE[0] == stamp:
+        return _REGISTRY_CACHE[1], _REGISTRY_CACHE[2]
+    
+    agents = discover_agents(project_dir / "agents")
+    listing = _format_agents_listing(agents)
+    _REGISTRY_CACHE = (stamp, agents, listing)
+    return agents, listing
+
+
 def get_available_agents() -> list[dict]:
     """Get list of all available agents in current project."""
-    agents = []
-    project_dir = get_project_config_dir()
-    if project_dir:
-        project_agents_dir = project_dir / "agents"
-        if project_agents_dir.exists():
-            agents = discover_agents(project_agents_dir)
-    return agents
+    return list(_get_registry()[0])
+
+
+def get_available_agents_text() -> str:
+    """Get the pre-joined "Available Agents" prompt section ("" if none)."""
+    return _get_registry()[1]
 
 
 async def create_agent_command(name: Optional[str] = None):
@@ -144,6 +201,7 @@ async def create_agent_command(name: Optional[str] = None):
         console.print(f"[{COLOR_INTERACTIVE}]✓[/{COLOR_INTERACTIVE}] Created .sudosu/ in current directory")
     
     agents_dir.mkdir(parents=True, exist_ok=True)
+    reset_dir_cache()
     
     # Check if agent already exists in this project
     if (agents_dir / name).exists():
@@ -235,6 +293,7 @@ You are {description.lower()}.
             system_prompt=system_prompt,
             integrations=connected_integrations,
         )
+        invalidate_agents_cache()
         console.print(f"[{COLOR_INTERACTIVE}]✓[/{COLOR_INTERACTIVE}] Agent [{COLOR_PRIMARY}]'{name}'[/{COLOR_PRIMARY}] created at {agent_path}", highlight=False)
         console.print(f"[{COLOR_INTERACTIVE}]ℹ[/{COLOR_INTERACTIVE}] Use [{COLOR_PRIMARY}]@{name}[/{COLOR_PRIMARY}] to start chatting", highlight=False)
         if connected_integrations:
@@ -274,6 +333,7 @@ async def delete_agent_command(name: Optional[str] = None):
     import shutil
     try:
         shutil.rmtree(agent_path)
+        invalidate_agents_cache()
         console.print(f"[{COLOR_INTERACTIVE}]✓[/{COLOR_INTERACTIVE}] Agent [{COLOR_PRIMARY}]'{name}'[/{COLOR_PRIMARY}] deleted", highlight=False)
     except Exception as e:
         print_error(f"Failed to delete agent: {e}")
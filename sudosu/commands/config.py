@@ -1,5 +1,7 @@
 """Config command handler."""
 
+from typing import Any
+
 from sudosu.core import load_config, set_config_value, get_mode, set_mode, get_backend_url
 from sudosu.ui import (
     console,
@@ -12,6 +14,27 @@ from sudosu.ui import (
 )
 
 
+# Keys that can be changed with /config set, in the order they're listed;
+# the frozenset is what membership checks use
+_CONFIG_KEYS = (
+    "backend_url",
+    "dev_backend_url",
+    "prod_backend_url",
+    "api_key",
+    "default_model",
+    "theme",
+    "max_concurrent_agents",
+)
+_VALID_KEYS = frozenset(_CONFIG_KEYS)
+
+
+def _mask(key: str, value: Any) -> Any:
+    """Mask sensitive values (any key containing "key") for display."""
+    if "key" not in key.lower() or not value:
+        return value
+    return value[:4] + "..." + value[-4:] if len(value) > 8 else "****"
+
+
 def show_config():
     """Show current configuration."""
     config = load_config()
@@ -25,13 +48,7 @@ def show_config():
     console.print(f"  [{COLOR_INTERACTIVE}]active_backend_url[/{COLOR_INTERACTIVE}]: {current_url}\n")
     
     for key, value in config.items():
-        # Mask API key
-        if "key" in key.lower() and value:
-            display_value = value[:4] + "..." + value[-4:] if len(value) > 8 else "****"
-        else:
-            display_value = value
-        
-        console.print(f"  [{COLOR_INTERACTIVE}]{key}[/{COLOR_INTERACTIVE}]: {display_value}")
+        console.print(f"  [{COLOR_INTERACTIVE}]{key}[/{COLOR_INTERACTIVE}]: {_mask(key, value)}")
     
     console.print()
     console.print("[dim]Tip: Use '/config mode dev' or '/config mode prod' to switch environments[/dim]\n")
@@ -39,22 +56,13 @@ def show_config():
 
 def set_config(key: str, value: str):
     """Set a configuration value."""
-    valid_keys = ["backend_url", "dev_backend_url", "prod_backend_url", "api_key", "default_model", "theme"]
-    
-    if key not in valid_keys:
+    if key not in _VALID_KEYS:
         print_error(f"Invalid key: {key}")
-        print_info(f"Valid keys: {', '.join(valid_keys)}")
+        print_info(f"Valid keys: {', '.join(_CONFIG_KEYS)}")
         return
     
     set_config_value(key, value)
-    
-    # Mask display for sensitive values
-    if "key" in key.lower():
-        display_value = value[:4] + "..." + value[-4:] if len(value) > 8 else "****"
-    else:
-        display_value = value
-    
-    print_success(f"Set {key} = {display_value}")
+    print_success(f"Set {key} = {_mask(key, value)}")
 
 
 def switch_mode(mode: str):
@@ -73,24 +81,36 @@ def switch_mode(mode: str):
         print_error(f"Failed to switch mode: {e}")
 
 
-async def handle_config_command(args: list[str]):
-    """Handle /config command with subcommands."""
-    if not args:
+async def handle_config_command(args: str = ""):
+    """Handle /config command with subcommands.
+    
+    Args:
+        args: Everything after "/config", e.g. "set theme dark"
+    """
+    parts = args.split(None, 1)
+    subcommand = parts[0] if parts else ""
+    rest = parts[1] if len(parts) > 1 else ""
+    
+    if not subcommand:
         show_config()
         return
     
-    if args[0] == "set":
-        if len(args) < 3:
+    if subcommand == "set":
+        # The value is the untouched tail, so it may contain spaces
+        set_args = rest.split(None, 1)
+        if len(set_args) < 2:
             print_error("Usage: /config set <key> <value>")
             return
-        set_config(args[1], " ".join(args[2:]))
-    elif args[0] == "mode":
-        if len(args) < 2:
+        key, value = set_args[0], set_args[1].strip()
+        set_config(key, value)
+    elif subcommand == "mode":
+        mode = rest.split()
+        if not mode:
             current_mode = get_mode()
             print_info(f"Current mode: {current_mode.upper()}")
             print_info("Usage: /config mode <dev|prod>")
             return
-        switch_mode(args[1])
+        switch_mode(mode[0])
     else:
-        print_error(f"Unknown subcommand: {args[0]}")
+        print_error(f"Unknown subcommand: {subcommand}")
         print_info("Usage: /config or /config set <key> <value> or /config mode <dev|prod>")
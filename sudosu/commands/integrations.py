@@ -5,11 +5,11 @@ Google Sheets, and any other Composio-configured tool.
 """
 
 import asyncio
+import functools
 import os
+import random
 import time
-import webbrowser
-
-import httpx
+from typing import TYPE_CHECKING, Callable, Optional
 
 from sudosu.core import get_config_value, set_config_value, get_backend_url
 from sudosu.ui import (
@@ -24,6 +24,39 @@ from sudosu.ui import (
     COLOR_INTERACTIVE,
 )
 
+if TYPE_CHECKING:
+    import httpx
+
+
+# Shared HTTP client so repeated calls (e.g. status polling) reuse keep-alive
+# connections instead of paying a new TCP + TLS handshake per request
+_client: "httpx.AsyncClient | None" = None
+
+
+def _get_client() -> "httpx.AsyncClient":
+    """Get or create the shared HTTP client for backend integration calls.
+    
+    httpx is imported here rather than at module level so that CLI startup
+    (e.g. `sudosu --version`) doesn't pay for it.
+    """
+    import httpx
+    
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=4, max_connections=8),
+        )
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client (call once when the session ends)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
 
 def get_http_backend_url() -> str:
     """Get the HTTP backend URL derived from the WebSocket URL.
@@ -75,11 +108,15 @@ def get_display_name(toolkit: str) -> str:
     return TOOLKIT_DISPLAY_NAMES.get(toolkit, toolkit.title())
 
 
+@functools.lru_cache(maxsize=1)
 def get_user_id() -> str:
     """Get or create a unique user ID for this CLI installation.
     
     The user_id is stored in ~/.sudosu/config.yaml and is used
     to associate integrations (like Gmail) with this user.
+    
+    The value never changes within a process, so it is cached after the
+    first lookup; use get_user_id.cache_clear() to force a reload.
     """
     user_id = get_config_value("user_id")
     if not user_id:
@@ -99,16 +136,16 @@ async def get_available_integrations() -> list[dict]:
     backend_url = get_http_backend_url()
     
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(
-                f"{backend_url}/api/integrations",
-                params={"user_id": user_id},
-            )
-            
-            if response.status_code == 200:
-                return response.json()
-            else:
-                return {"available": [], "connected": [], "details": []}
+        client = _get_client()
+        response = await client.get(
+            f"{backend_url}/api/integrations",
+            params={"user_id": user_id},
+        )
+
+        if response.status_code == 200:
+            return response.json()
+        else:
+            return {"available": [], "connected": [], "details": []}
                 
     except Exception as e:
         return {"available": [], "connected": [], "error": str(e)}
@@ -127,15 +164,15 @@ async def check_integration_status(integration: str) -> dict:
     backend_url = get_http_backend_url()
     
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(
-                f"{backend_url}/api/integrations/{integration}/status/{user_id}",
-            )
-            
-            if response.status_code == 200:
-                return response.json()
-            else:
-                return {"connected": False, "error": f"HTTP {response.status_code}"}
+        client = _get_client()
+        response = await client.get(
+            f"{backend_url}/api/integrations/{integration}/status/{user_id}",
+        )
+
+        if response.status_code == 200:
+            return response.json()
+        else:
+            return {"connected": False, "error": f"HTTP {response.status_code}"}
                 
     except Exception as e:
         return {"connected": False, "error": str(e)}
@@ -154,17 +191,18 @@ async def initiate_connection(integration: str) -> dict:
     backend_url = get_http_backend_url()
     
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"{backend_url}/api/integrations/{integration}/connect",
-                json={"user_id": user_id},
-            )
-            
-            if response.status_code == 200:
-                return response.json()
-            else:
-                data = response.json()
-                return {"error": data.get("detail", f"HTTP {response.status_code}")}
+        client = _get_client()
+        response = await client.post(
+            f"{backend_url}/api/integrations/{integration}/connect",
+            json={"user_id": user_id},
+            timeout=30.0,
+        )
+
+        if response.status_code == 200:
+            return response.json()
+        else:
+            data = response.json()
+            return {"error": data.get("detail", f"HTTP {response.status_code}")}
                 
     except Exception as e:
         return {"error": str(e)}
@@ -183,48 +221,74 @@ async def disconnect_integration(integration: str) -> dict:
     backend_url = get_http_backend_url()
     
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(
-                f"{backend_url}/api/integrations/{integration}/disconnect",
-                json={"user_id": user_id},
-            )
-            
-            if response.status_code == 200:
-                return response.json()
-            else:
-                data = response.json()
-                return {"success": False, "error": data.get("detail", f"HTTP {response.status_code}")}
+        client = _get_client()
+        response = await client.post(
+            f"{backend_url}/api/integrations/{integration}/disconnect",
+            json={"user_id": user_id},
+        )
+
+        if response.status_code == 200:
+            return response.json()
+        else:
+            data = response.json()
+            return {"success": False, "error": data.get("detail", f"HTTP {response.status_code}")}
                 
     except Exception as e:
         return {"success": False, "error": str(e)}
 
 
+# Backoff bounds (seconds) for polling OAuth completion
+POLL_INITIAL_DELAY = 0.5
+POLL_MAX_DELAY = 5.0
+
+
+def _next_poll_delay(delay: float) -> float:
+    """Grow the polling delay exponentially, capped at POLL_MAX_DELAY."""
+    return min(delay * 1.5, POLL_MAX_DELAY)
+
+
+async def _sleep_with_jitter(delay: float) -> None:
+    """Sleep for delay plus up to 10% random jitter."""
+    await asyncio.sleep(delay + random.uniform(0, delay * 0.1))
+
+
 async def poll_for_connection(
     integration: str = "gmail",
     timeout: int = 120,
-    poll_interval: int = 2,
-) -> bool:
+    poll_interval: float = POLL_INITIAL_DELAY,
+    on_poll: Optional[Callable[[], None]] = None,
+) -> tuple[bool, dict]:
     """Poll for connection completion after user authorizes in browser.
     
+    Polls quickly at first and backs off exponentially (with jitter) up to
+    POLL_MAX_DELAY, since most users finish OAuth within the first minute.
+    
     Args:
         integration: Name of the integration
         timeout: Maximum seconds to wait
-        poll_interval: Seconds between polls
+        poll_interval: Initial seconds between polls
+        on_poll: Optional callback invoked before each poll (e.g. progress dots)
         
     Returns:
-        True if connected successfully, False otherwise
+        Tuple of (connected, last status dict from the backend)
     """
     start_time = time.time()
+    delay = poll_interval
+    status: dict = {}
     
     while time.time() - start_time < timeout:
+        if on_poll:
+            on_poll()
+        
         status = await check_integration_status(integration)
         
         if status.get("connected"):
-            return True
+            return True, status
         
-        await asyncio.sleep(poll_interval)
+        await _sleep_with_jitter(delay)
+        delay = _next_poll_delay(delay)
     
-    return False
+    return False, status
 
 
 async def handle_connect_command(args: str = ""):
@@ -308,29 +372,21 @@ async def handle_connect_command(args: str = ""):
     console.print(f"[link={auth_url}]{auth_url}[/link]")
     console.print()
     
-    # Try to open the browser
+    # Try to open the browser (off the event loop - launching can block)
+    import webbrowser
+    
     try:
-        webbrowser.open(auth_url)
+        await asyncio.to_thread(webbrowser.open, auth_url)
     except Exception:
         pass  # URL already displayed above
     
     # Poll for completion
     console.print(f"[{COLOR_PRIMARY}]Waiting for authorization...[/{COLOR_PRIMARY}]", end="")
     
-    connected = False
-    timeout = 120  # 2 minutes
-    poll_interval = 2
-    start_time = time.time()
-    
-    while time.time() - start_time < timeout:
-        console.print(".", end="", style=COLOR_PRIMARY)
-        
-        status = await check_integration_status(integration)
-        if status.get("connected"):
-            connected = True
-            break
-        
-        await asyncio.sleep(poll_interval)
+    connected, _ = await poll_for_connection(
+        integration,
+        on_poll=lambda: console.print(".", end="", style=COLOR_PRIMARY),
+    )
     
     console.print()  # New line after dots
     console.print()
@@ -461,15 +517,15 @@ async def get_registry_info() -> dict:
     backend_url = get_http_backend_url()
     
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(
-                f"{backend_url}/api/registry/{user_id}/summary",
-            )
-            
-            if response.status_code == 200:
-                return response.json()
-            else:
-                return {"error": f"HTTP {response.status_code}"}
+        client = _get_client()
+        response = await client.get(
+            f"{backend_url}/api/registry/{user_id}/summary",
+        )
+
+        if response.status_code == 200:
+            return response.json()
+        else:
+            return {"error": f"HTTP {response.status_code}"}
                 
     except Exception as e:
         return {"error": str(e)}
@@ -513,10 +569,12 @@ async def handle_integrations_command(args: str = ""):  # noqa: ARG001
             else:
                 console.print(f"  [dim]○[/dim] {name}: [dim]Not connected[/dim]")
     else:
-        # Fallback: check each available integration
-        for toolkit in available:
+        # Fallback: check all available integrations concurrently
+        statuses = await asyncio.gather(
+            *(check_integration_status(toolkit) for toolkit in available)
+        )
+        for toolkit, status in zip(available, statuses):
             display_name = get_display_name(toolkit)
-            status = await check_integration_status(toolkit)
             
             if status.get("connected"):
                 console.print(f"  [{COLOR_INTERACTIVE}]●[/{COLOR_INTERACTIVE}] {display_name}: [{COLOR_INTERACTIVE}]Connected[/{COLOR_INTERACTIVE}]")
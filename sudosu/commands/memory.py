@@ -20,6 +20,15 @@ from sudosu.ui import (
 )
 
 
+def _format_duration(seconds: float) -> str:
+    """Format a duration in seconds as seconds, minutes or hours."""
+    if seconds < 60:
+        return f"{seconds:.0f} seconds"
+    if seconds < 3600:
+        return f"{seconds/60:.1f} minutes"
+    return f"{seconds/3600:.1f} hours"
+
+
 async def handle_memory_command(args: list[str]):
     """
     Handle /memory commands for SHARED conversation memory management.
@@ -60,19 +69,24 @@ async def handle_memory_command(args: list[str]):
 
 def _show_session_info(session_mgr):
     """Display current session information."""
-    console.print(f"\n[bold {COLOR_SECONDARY}]📝 Session Info[/bold {COLOR_SECONDARY}]")
-    console.print(f"  Session ID: [dim]{session_mgr.session_id[:8]}...[/dim]")
-    console.print(f"  Thread ID: [dim]{session_mgr.thread_id[:16]}...[/dim]")
-    console.print(f"  Active Agent: [{COLOR_INTERACTIVE}]@{session_mgr.get_active_agent()}[/{COLOR_INTERACTIVE}]")
-    console.print(f"  Messages: [{COLOR_PRIMARY}]{session_mgr.message_count}[/{COLOR_PRIMARY}]")
+    lines = [
+        f"\n[bold {COLOR_SECONDARY}]📝 Session Info[/bold {COLOR_SECONDARY}]",
+        f"  Session ID: [dim]{session_mgr.session_id[:8]}...[/dim]",
+        f"  Thread ID: [dim]{session_mgr.thread_id[:16]}...[/dim]",
+        f"  Active Agent: [{COLOR_INTERACTIVE}]@{session_mgr.get_active_agent()}[/{COLOR_INTERACTIVE}]",
+        f"  Messages: [{COLOR_PRIMARY}]{session_mgr.message_count}[/{COLOR_PRIMARY}]",
+    ]
     
     if session_mgr.is_routed:
-        console.print(f"  Status: [{COLOR_INTERACTIVE}]Routed from sudosu[/{COLOR_INTERACTIVE}]")
+        lines.append(f"  Status: [{COLOR_INTERACTIVE}]Routed from sudosu[/{COLOR_INTERACTIVE}]")
     
-    console.print()
-    console.print("[dim]💡 All agents share the same conversation context.[/dim]")
-    console.print("[dim]   Use '/back' to return to sudosu from a sub-agent.[/dim]")
-    console.print()
+    lines.extend([
+        "",
+        "[dim]💡 All agents share the same conversation context.[/dim]",
+        "[dim]   Use '/back' to return to sudosu from a sub-agent.[/dim]",
+        "",
+    ])
+    console.print("\n".join(lines))
 
 
 async def _handle_clear(session_mgr):
@@ -94,13 +108,7 @@ def _show_conversation_details(session_mgr):
         console.print(f"  Session ID: [dim]{session_mgr.session_id}[/dim]")
         
         stats = session_mgr.get_stats()
-        duration = stats["duration_seconds"]
-        if duration < 60:
-            console.print(f"  Duration: {duration:.0f} seconds")
-        elif duration < 3600:
-            console.print(f"  Duration: {duration/60:.1f} minutes")
-        else:
-            console.print(f"  Duration: {duration/3600:.1f} hours")
+        console.print(f"  Duration: {_format_duration(stats['duration_seconds'])}")
         
         if session_mgr.is_routed:
             console.print(f"\n[dim]You were routed here by sudosu.[/dim]")
@@ -133,38 +141,42 @@ def _show_active_agent(session_mgr):
 def _show_stats(session_mgr):
     """Show session statistics."""
     stats = session_mgr.get_stats()
-    
-    console.print(f"\n[bold {COLOR_SECONDARY}]📊 Session Statistics[/bold {COLOR_SECONDARY}]")
-    console.print(f"  Session ID: [dim]{stats['session_id'][:8]}...[/dim]")
-    console.print(f"  Thread ID: [dim]{stats['thread_id'][:16]}...[/dim]")
-    console.print(f"  Active Agent: [{COLOR_INTERACTIVE}]@{stats['active_agent']}[/{COLOR_INTERACTIVE}]")
-    console.print(f"  Total Messages: [{COLOR_PRIMARY}]{stats['message_count']}[/{COLOR_PRIMARY}]")
-    
+    session_id = stats["session_id"]
+    thread_id = stats["thread_id"]
+    active_agent = stats["active_agent"]
+    message_count = stats["message_count"]
     duration = stats["duration_seconds"]
-    if duration < 60:
-        console.print(f"  Session Duration: {duration:.0f} seconds")
-    elif duration < 3600:
-        console.print(f"  Session Duration: {duration/60:.1f} minutes")
-    else:
-        console.print(f"  Session Duration: {duration/3600:.1f} hours")
+    is_routed = stats["is_routed"]
     
-    if stats["is_routed"]:
-        console.print(f"  Status: [{COLOR_INTERACTIVE}]Routed conversation[/{COLOR_INTERACTIVE}]")
+    lines = [
+        f"\n[bold {COLOR_SECONDARY}]📊 Session Statistics[/bold {COLOR_SECONDARY}]",
+        f"  Session ID: [dim]{session_id[:8]}...[/dim]",
+        f"  Thread ID: [dim]{thread_id[:16]}...[/dim]",
+        f"  Active Agent: [{COLOR_INTERACTIVE}]@{active_agent}[/{COLOR_INTERACTIVE}]",
+        f"  Total Messages: [{COLOR_PRIMARY}]{message_count}[/{COLOR_PRIMARY}]",
+        f"  Session Duration: {_format_duration(duration)}",
+    ]
     
-    console.print()
+    if is_routed:
+        lines.append(f"  Status: [{COLOR_INTERACTIVE}]Routed conversation[/{COLOR_INTERACTIVE}]")
+    
+    lines.append("")
+    console.print("\n".join(lines))
 
 
 def _show_help():
     """Show memory command help."""
-    console.print(f"\n[bold {COLOR_SECONDARY}]Memory Commands[/bold {COLOR_SECONDARY}]")
-    console.print(f"  [{COLOR_INTERACTIVE}]/memory[/{COLOR_INTERACTIVE}]        - Show session info and conversation status")
-    console.print(f"  [{COLOR_INTERACTIVE}]/memory show[/{COLOR_INTERACTIVE}]   - Show detailed conversation info")
-    console.print(f"  [{COLOR_INTERACTIVE}]/memory clear[/{COLOR_INTERACTIVE}]  - Clear conversation and start fresh")
-    console.print(f"  [{COLOR_INTERACTIVE}]/memory agent[/{COLOR_INTERACTIVE}]  - Show which agent is currently active")
-    console.print(f"  [{COLOR_INTERACTIVE}]/memory stats[/{COLOR_INTERACTIVE}]  - Show session statistics")
-    console.print(f"  [{COLOR_INTERACTIVE}]/memory help[/{COLOR_INTERACTIVE}]   - Show this help")
-    console.print()
-    console.print("[dim]💡 All agents share the same conversation context.")
-    console.print("   When sudosu routes you to a sub-agent, follow-up")
-    console.print("   messages go to that agent until you use /back.[/dim]")
-    console.print()
+    # Single print: the [dim] tip spans several lines, so it must be one markup string
+    console.print(
+        f"\n[bold {COLOR_SECONDARY}]Memory Commands[/bold {COLOR_SECONDARY}]\n"
+        f"  [{COLOR_INTERACTIVE}]/memory[/{COLOR_INTERACTIVE}]        - Show session info and conversation status\n"
+        f"  [{COLOR_INTERACTIVE}]/memory show[/{COLOR_INTERACTIVE}]   - Show detailed conversation info\n"
+        f"  [{COLOR_INTERACTIVE}]/memory clear[/{COLOR_INTERACTIVE}]  - Clear conversation and start fresh\n"
+        f"  [{COLOR_INTERACTIVE}]/memory agent[/{COLOR_INTERACTIVE}]  - Show which agent is currently active\n"
+        f"  [{COLOR_INTERACTIVE}]/memory stats[/{COLOR_INTERACTIVE}]  - Show session statistics\n"
+        f"  [{COLOR_INTERACTIVE}]/memory help[/{COLOR_INTERACTIVE}]   - Show this help\n"
+        "\n"
+        "[dim]💡 All agents share the same conversation context.\n"
+        "   When sudosu routes you to a sub-agent, follow-up\n"
+        "   messages go to that agent until you use /back.[/dim]\n"
+    )
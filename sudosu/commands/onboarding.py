@@ -6,7 +6,6 @@ collecting profile information to personalize the agent experience.
 
 from typing import Optional
 
-import httpx
 from prompt_toolkit import PromptSession
 
 from sudosu.commands.integrations import get_http_backend_url, get_user_id
@@ -56,6 +55,8 @@ async def check_remote_profile() -> Optional[dict]:
     user_id = get_user_id()
     backend_url = get_http_backend_url()
     
+    import httpx
+    
     try:
         async with httpx.AsyncClient(timeout=5.0) as client:
             response = await client.get(f"{backend_url}/api/users/{user_id}")
@@ -78,6 +79,8 @@ async def save_profile_to_backend(profile: dict) -> bool:
     """
     backend_url = get_http_backend_url()
     
+    import httpx
+    
     try:
         async with httpx.AsyncClient(timeout=10.0) as client:
             response = await client.post(
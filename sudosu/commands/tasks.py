@@ -10,7 +10,6 @@ import asyncio
 from datetime import datetime
 from typing import Optional
 
-import httpx
 import typer
 from rich.console import Console
 from rich.panel import Panel
@@ -19,6 +18,7 @@ from rich.table import Table
 
 from sudosu.commands.integrations import get_user_id
 from sudosu.core import get_backend_url
+from sudosu.core.aio import run_async as _run_loop
 
 console = Console()
 app = typer.Typer(help="Manage background tasks")
@@ -44,11 +44,11 @@ def run_async(coro):
         # We're in an async context, create a task
         import concurrent.futures
         with concurrent.futures.ThreadPoolExecutor() as executor:
-            future = executor.submit(asyncio.run, coro)
+            future = executor.submit(_run_loop, coro)
             return future.result()
     except RuntimeError:
-        # No running loop, use asyncio.run()
-        return asyncio.run(coro)
+        # No running loop, run one here (uvloop when installed)
+        return _run_loop(coro)
 
 
 def get_api_url() -> str:
@@ -71,6 +71,8 @@ async def _list_tasks(status: Optional[str], limit: int) -> list[dict]:
     
     api_url = get_api_url()
     
+    import httpx
+    
     async with httpx.AsyncClient() as client:
         params = {"user_id": user_id, "limit": limit}
         if status and status != "all":
@@ -99,6 +101,8 @@ async def _get_task(task_id: str) -> Optional[dict]:
     
     api_url = get_api_url()
     
+    import httpx
+    
     async with httpx.AsyncClient() as client:
         try:
             response = await client.get(
@@ -127,6 +131,8 @@ async def _get_task_logs(task_id: str, limit: int = 50) -> list[dict]:
     
     api_url = get_api_url()
     
+    import httpx
+    
     async with httpx.AsyncClient() as client:
         try:
             response = await client.get(
@@ -150,6 +156,8 @@ async def _get_task_report(task_id: str) -> Optional[str]:
     
     api_url = get_api_url()
     
+    import httpx
+    
     async with httpx.AsyncClient() as client:
         try:
             response = await client.get(
@@ -180,6 +188,8 @@ async def _cancel_task(task_id: str) -> bool:
     
     api_url = get_api_url()
     
+    import httpx
+    
     async with httpx.AsyncClient() as client:
         try:
             response = await client.post(
@@ -1,22 +1,50 @@
 """Core configuration management for Sudosu."""
 
+import copy
 import os
+import re
+import stat
+import tempfile
 from pathlib import Path
 from typing import Any, Optional
 
-import yaml
 from dotenv import load_dotenv
 
 
 # Load environment variables from .env file
 load_dotenv()
 
+# PyYAML is imported on first use (see _yaml()), so commands that never read
+# or write config.yaml don't pay for it at startup
+_yaml_module = None
+YamlLoader = None
+YamlDumper = None
+
+
+def _yaml():
+    """Import PyYAML once and pick the fastest available loader/dumper."""
+    global _yaml_module, YamlLoader, YamlDumper
+    if _yaml_module is None:
+        import yaml
+        
+        # Prefer the libyaml-backed C loader/dumper (several times faster),
+        # falling back to the pure-Python safe versions without libyaml
+        YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+        _yaml_module = yaml
+    return _yaml_module
+
 # Default paths - use XDG-compliant location for app data
 # ~/.local/share/sudosu/ for app data (history, etc.)
 # ~/.config/sudosu/ for config (or keep ~/.sudosu/config.yaml for backwards compat)
-APP_DATA_DIR = Path.home() / ".local" / "share" / "sudosu"
-GLOBAL_CONFIG_DIR = Path.home() / ".sudosu"  # Keep for backwards compatibility
+# The *_STR forms are what the hot paths use: os.path on plain strings avoids
+# building Path objects on every config read
+_HOME_STR = os.path.expanduser("~")
+_GLOBAL_CONFIG_DIR_STR = os.path.join(_HOME_STR, ".sudosu")
+APP_DATA_DIR = Path(_HOME_STR, ".local", "share", "sudosu")
+GLOBAL_CONFIG_DIR = Path(_GLOBAL_CONFIG_DIR_STR)  # Keep for backwards compatibility
 CONFIG_FILE = "config.yaml"
+_CONFIG_FILE_STR = os.path.join(_GLOBAL_CONFIG_DIR_STR, CONFIG_FILE)
 
 # Default backend URLs (hardcoded, not from env vars)
 DEFAULT_DEV_BACKEND_URL = "ws://localhost:8000/ws"
@@ -33,13 +61,59 @@ def get_app_data_dir() -> Path:
     return APP_DATA_DIR
 
 
+# <cwd>/.sudosu listings, keyed by cwd and validated against the directory's
+# mtime_ns (which changes whenever a subdirectory is added or removed, by us,
+# the agent's tools or anything outside the CLI)
+_PROJECT_DIR_CACHE: dict[str, tuple[int, frozenset]] = {}
+_PROJECT_DIR_CACHE_MAX = 8
+
+
+def _probe_project_sudosu(cwd: str) -> tuple[bool, frozenset]:
+    """Read <cwd>/.sudosu, reusing the last listing while it's unchanged.
+    
+    Returns:
+        Tuple of (exists, names of its subdirectories). A cache hit costs a
+        single stat() instead of a directory read.
+    """
+    path = os.path.join(cwd, ".sudosu")
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        _PROJECT_DIR_CACHE.pop(cwd, None)
+        return False, frozenset()
+    
+    cached = _PROJECT_DIR_CACHE.get(cwd)
+    if cached is not None and cached[0] == mtime:
+        return True, cached[1]
+    
+    try:
+        with os.scandir(path) as entries:
+            subdirs = frozenset(e.name for e in entries if e.is_dir())
+    except OSError:
+        return False, frozenset()
+    
+    if len(_PROJECT_DIR_CACHE) >= _PROJECT_DIR_CACHE_MAX:
+        _PROJECT_DIR_CACHE.clear()
+    _PROJECT_DIR_CACHE[cwd] = (mtime, subdirs)
+    return True, subdirs
+
+
+def _find_project_dir(cwd: str, subdir: str = "") -> Optional[Path]:
+    """Return <cwd>/.sudosu[/<subdir>] if that directory exists."""
+    exists, subdirs = _probe_project_sudosu(cwd)
+    if not exists or (subdir and subdir not in subdirs):
+        return None
+    return Path(cwd, ".sudosu", subdir) if subdir else Path(cwd, ".sudosu")
+
+
+def reset_dir_cache() -> None:
+    """Forget cached project directory probes (after creating/removing them)."""
+    _PROJECT_DIR_CACHE.clear()
+
+
 def get_project_config_dir(cwd: Optional[Path] = None) -> Optional[Path]:
     """Get the project-specific configuration directory if it exists."""
-    cwd = cwd or Path.cwd()
-    project_config = cwd / ".sudosu"
-    if project_config.exists():
-        return project_config
-    return None
+    return _find_project_dir(str(cwd) if cwd else os.getcwd())
 
 
 def ensure_config_structure() -> Path:
@@ -49,14 +123,12 @@ def ensure_config_structure() -> Path:
     NOTE: Only creates config.yaml in ~/.sudosu/, nothing else.
     All other files (.sudosu/AGENT.md, agents/, etc.) are project-local.
     """
-    config_dir = get_global_config_dir()
-    
     # Create config directory (just for config.yaml)
-    config_dir.mkdir(parents=True, exist_ok=True)
+    os.makedirs(_GLOBAL_CONFIG_DIR_STR, exist_ok=True)
     
     # Create default config if it doesn't exist
-    config_file = config_dir / CONFIG_FILE
-    if not config_file.exists():
+    config_file = _CONFIG_FILE_STR
+    if not os.path.exists(config_file):
         default_config = {
             "mode": "prod",  # default to production
             "backend_url": DEFAULT_PROD_BACKEND_URL,
@@ -66,10 +138,11 @@ def ensure_config_structure() -> Path:
             "default_model": "gemini-2.5-pro",
             "theme": "default",
         }
+        yaml = _yaml()
         with open(config_file, "w", encoding="utf-8") as f:
-            yaml.dump(default_config, f, default_flow_style=False)
+            yaml.dump(default_config, f, Dumper=YamlDumper, default_flow_style=False)
     
-    return config_dir
+    return GLOBAL_CONFIG_DIR
 
 
 def ensure_app_data_dir() -> Path:
@@ -108,37 +181,195 @@ def ensure_project_structure(cwd: Optional[Path] = None) -> Path:
     if not default_agent_file.exists():
         default_agent_file.write_text(generate_default_agent_md())
     
+    reset_dir_cache()
     return project_config
 
 
-def load_config() -> dict:
-    """Load the global configuration."""
-    config_file = get_global_config_dir() / CONFIG_FILE
+# Parsed config.yaml, keyed by the file's (mtime_ns, size) when it was read.
+# Repeated lookups (get_backend_url() runs on every backend call) then cost a
+# single stat() instead of a full YAML parse.
+_CONFIG_CACHE: Optional[tuple[tuple[int, int], dict]] = None
+
+
+def _read_config() -> dict:
+    """Return the parsed global config, re-parsing only if the file changed.
     
-    if not config_file.exists():
+    The returned dict is shared with the cache and must not be modified.
+    """
+    global _CONFIG_CACHE
+    config_file = _CONFIG_FILE_STR
+    
+    try:
+        st = os.stat(config_file)
+    except FileNotFoundError:
+        _CONFIG_CACHE = None
         return {}
     
+    stamp = (st.st_mtime_ns, st.st_size)
+    if _CONFIG_CACHE is not None and _CONFIG_CACHE[0] == stamp:
+        return _CONFIG_CACHE[1]
+    
+    yaml = _yaml()
     with open(config_file, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+        config = yaml.load(f, Loader=YamlLoader) or {}
+    _CONFIG_CACHE = (stamp, config)
+    return config
+
+
+# Top-level string settings that _load_config_shallow may answer without a
+# full YAML parse, and the line shape it accepts (a bare, unquoted value)
+_SHALLOW_KEYS = frozenset(("mode", "backend_url", "dev_backend_url", "prod_backend_url"))
+_SHALLOW_LINE_RE = re.compile(r"^([A-Za-z_]\w*):[ \t]+([A-Za-z][\w./:+\-]*)[ \t]*$")
+# Plain words YAML resolves to null/bool rather than a string
+_YAML_NON_STRINGS = frozenset(("null", "true", "false", "yes", "no", "on", "off", "y", "n"))
+
+
+def _load_config_shallow(key: str) -> tuple[bool, Any]:
+    """Look up a top-level scalar by scanning config.yaml's lines.
+    
+    Returns:
+        Tuple of (found, value); found is False whenever the answer isn't
+        certain (key missing or repeated, quoted/complex value, several
+        documents, file missing), in which case callers fall back to the
+        full parse.
+    """
+    config_file = _CONFIG_FILE_STR
+    try:
+        with open(config_file, "r", encoding="utf-8") as f:
+            lines = f.read().split("\n")
+    except OSError:
+        return False, None
+    
+    hit = None
+    for i, line in enumerate(lines):
+        if line.startswith(("---", "...")):
+            # Document markers: load_config() may reject the file outright
+            return False, None
+        if not line.lstrip("\"'").startswith(key):
+            continue
+        if not line.lstrip("\"'")[len(key):].lstrip("\"' \t").startswith(":"):
+            continue  # a longer key sharing the prefix
+        if hit is not None:
+            # Repeated key: YAML keeps the last one, so let it decide
+            return False, None
+        hit = i
+    if hit is None:
+        return False, None
+    
+    match = _SHALLOW_LINE_RE.match(lines[hit])
+    if not match or match.group(2).lower() in _YAML_NON_STRINGS:
+        return False, None
+    # An indented next line means the value continues - let YAML handle it
+    if hit + 1 < len(lines) and lines[hit + 1][:1] in (" ", "\t"):
+        return False, None
+    return True, match.group(2)
+
+
+def load_config() -> dict:
+    """Load the global configuration.
+    
+    Returns a copy, so callers are free to modify it.
+    """
+    return copy.deepcopy(_read_config())
+
+
+# (file stamp, YAML text) of the last save_config() write, so re-saving an
+# unchanged config doesn't touch the file (or invalidate _CONFIG_CACHE)
+_LAST_WRITTEN: Optional[tuple[tuple[int, int], str]] = None
+
+
+def _write_atomic(path: str, data: str) -> None:
+    """Replace path's contents with data via a synced temp file + os.replace.
+    
+    A symlinked config (e.g. from a dotfiles repo) is resolved first so the
+    real file is replaced and the link kept. The data is fsync'd before the
+    rename, so after a crash or power loss the file holds either the old or
+    the new config, never a truncated one.
+    """
+    path = os.path.realpath(path)
+    directory = os.path.dirname(path)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".config-", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp creates the file 0600; keep the existing file's permissions
+        try:
+            os.chmod(tmp_path, stat.S_IMODE(os.stat(path).st_mode))
+        except FileNotFoundError:
+            pass
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    
+    # Persist the rename itself (POSIX only; directories can't be opened on Windows)
+    try:
+        dir_fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
 
 
 def save_config(config: dict) -> None:
     """Save the global configuration."""
-    config_file = get_global_config_dir() / CONFIG_FILE
+    global _CONFIG_CACHE, _LAST_WRITTEN
+    config_file = _CONFIG_FILE_STR
+    
+    # Serialize in memory, then write the whole document at once
+    data = _yaml().dump(config, Dumper=YamlDumper, default_flow_style=False)
     
-    with open(config_file, "w", encoding="utf-8") as f:
-        yaml.dump(config, f, default_flow_style=False)
+    # Skip the write when the file still holds exactly this serialization
+    if _LAST_WRITTEN is not None and _LAST_WRITTEN[1] == data:
+        try:
+            st = os.stat(config_file)
+        except FileNotFoundError:
+            pass
+        else:
+            if (st.st_mtime_ns, st.st_size) == _LAST_WRITTEN[0]:
+                return
+    
+    _write_atomic(config_file, data)
+    
+    # Prime the cache with what was just written
+    st = os.stat(config_file)
+    stamp = (st.st_mtime_ns, st.st_size)
+    _CONFIG_CACHE = (stamp, copy.deepcopy(config))
+    _LAST_WRITTEN = (stamp, data)
 
 
 def get_config_value(key: str, default: Any = None) -> Any:
     """Get a specific configuration value."""
-    config = load_config()
-    return config.get(key, default)
+    # Before the first full parse, answer hot scalar lookups (backend URL,
+    # mode) with a line scan of the file
+    if _CONFIG_CACHE is None and key in _SHALLOW_KEYS:
+        found, value = _load_config_shallow(key)
+        if found:
+            return value
+    
+    value = _read_config().get(key, default)
+    # Hand out copies of nested values so the cached config stays intact
+    if isinstance(value, (dict, list)):
+        return copy.deepcopy(value)
+    return value
 
 
 def set_config_value(key: str, value: Any) -> None:
     """Set a specific configuration value."""
-    config = load_config()
+    current = _read_config()
+    # Nothing to do if the file already holds this value
+    if key in current and current[key] == value:
+        return
+    config = copy.deepcopy(current)
     config[key] = value
     save_config(config)
 
@@ -204,11 +435,7 @@ def get_agents_dir(project_first: bool = True) -> Optional[Path]:
         Path to project's .sudosu/agents/ or None if not in a project
     """
     if project_first:
-        project_dir = get_project_config_dir()
-        if project_dir:
-            agents_dir = project_dir / "agents"
-            if agents_dir.exists():
-                return agents_dir
+        return _find_project_dir(os.getcwd(), "agents")
     
     return None
 
@@ -220,19 +447,26 @@ def get_skills_dir(project_first: bool = True) -> Optional[Path]:
         Path to project's .sudosu/skills/ or None if not in a project
     """
     if project_first:
-        project_dir = get_project_config_dir()
-        if project_dir:
-            skills_dir = project_dir / "skills"
-            if skills_dir.exists():
-                return skills_dir
+        return _find_project_dir(os.getcwd(), "skills")
     
     return None
 
 
-# Export session management
-from sudosu.core.session import (
-    ConversationSession,
-    SessionManager,
-    get_session_manager,
-    reset_session_manager,
-)
+# Session management is re-exported lazily: importing sudosu.core for a config
+# lookup shouldn't drag in the session stack
+_SESSION_EXPORTS = frozenset((
+    "ConversationSession",
+    "SessionManager",
+    "get_session_manager",
+    "reset_session_manager",
+))
+
+
+def __getattr__(name: str) -> Any:
+    if name in _SESSION_EXPORTS:
+        from sudosu.core import session
+        
+        value = getattr(session, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,16 @@
+"""Event loop helpers shared by the CLI entry points."""
+
+import asyncio
+
+
+def run_async(main):
+    """Run a coroutine to completion, on uvloop when it is installed.
+
+    uvloop is an optional speedup (``pip install sudosu[speedups]``) for the
+    socket-heavy streaming path; the stock asyncio loop is used otherwise.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main)
+    return uvloop.run(main)
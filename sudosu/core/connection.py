@@ -3,11 +3,20 @@
 import asyncio
 import json
 import ssl
+import time
 from typing import Any, AsyncGenerator, Callable, Optional
 
 import certifi
 import websockets
 from websockets.client import WebSocketClientProtocol
+from websockets.protocol import State
+
+
+# A kept-open socket idle for longer than this is pinged before reuse: after
+# laptop sleep or a NAT/proxy timeout the peer may be gone without the local
+# state noticing, and the keepalive would take minutes to give up
+IDLE_PING_AFTER = 30.0
+IDLE_PING_TIMEOUT = 5.0
 
 
 class ConnectionManager:
@@ -17,6 +26,9 @@ class ConnectionManager:
         self.backend_url = backend_url
         self.ws: Optional[WebSocketClientProtocol] = None
         self._connected = False
+        self._last_used = 0.0
+        # Turns completed on the current socket (0 = opened for this turn)
+        self._turns = 0
     
     async def connect(self) -> bool:
         """Establish connection to the backend.
@@ -47,22 +59,63 @@ class ConnectionManager:
                 max_size=20_000_000, # 20MB for large responses
             )
             self._connected = True
+            self._last_used = time.monotonic()
+            self._turns = 0
             return True
         except Exception as e:
             self._connected = False
             raise ConnectionError(f"Failed to connect to backend: {e}")
     
+    async def ensure_connected(self) -> bool:
+        """Connect only if there is no open connection already.
+        
+        Lets callers keep one manager for a whole session and reuse the
+        WebSocket across turns instead of reconnecting per message. A socket
+        that has been idle for a while must answer a ping first.
+        """
+        if self.is_connected:
+            if time.monotonic() - self._last_used < IDLE_PING_AFTER or await self._ping():
+                return True
+            self._abort()
+        await self.disconnect()
+        return await self.connect()
+    
+    async def _ping(self) -> bool:
+        """Check the peer is still there with one short ping."""
+        try:
+            pong = await self.ws.ping()
+            await asyncio.wait_for(pong, IDLE_PING_TIMEOUT)
+        except (asyncio.TimeoutError, websockets.exceptions.WebSocketException, OSError):
+            return False
+        self._last_used = time.monotonic()
+        return True
+    
+    def _abort(self) -> None:
+        """Drop a dead connection without waiting for a closing handshake."""
+        if self.ws is not None:
+            self.ws.transport.abort()
+        self._connected = False
+        self.ws = None
+    
+    async def _reconnect_and_send(self, message: dict) -> None:
+        """Replace the connection and send message on the new one."""
+        self._abort()
+        await self.connect()
+        await self.send(message)
+    
     async def disconnect(self) -> None:
         """Close the connection."""
         if self.ws:
-            await self.ws.close()
-            self._connected = False
-            self.ws = None
+            try:
+                await self.ws.close()
+            finally:
+                self._connected = False
+                self.ws = None
     
     @property
     def is_connected(self) -> bool:
-        """Check if connected to backend."""
-        return self._connected and self.ws is not None
+        """Check if connected to backend (and the socket is still open)."""
+        return self._connected and self.ws is not None and self.ws.state is State.OPEN
     
     async def send(self, message: dict) -> None:
         """Send a message to the backend."""
@@ -70,6 +123,7 @@ class ConnectionManager:
             raise ConnectionError("Not connected to backend")
         
         await self.ws.send(json.dumps(message))
+        self._last_used = time.monotonic()
     
     async def receive(self) -> dict:
         """Receive a message from the backend."""
@@ -77,6 +131,7 @@ class ConnectionManager:
             raise ConnectionError("Not connected to backend")
         
         msg = await self.ws.recv()
+        self._last_used = time.monotonic()
         return json.loads(msg)
     
     async def invoke_agent(
@@ -126,13 +181,31 @@ class ConnectionManager:
         if user_id:
             request["user_id"] = user_id
         
+        # A reused socket may have died while idle; if it closes before any
+        # frame of this turn arrives, the invoke is resent once on a new one
+        can_resend = self._turns > 0
+        
         # Send invoke request
-        await self.send(request)
+        try:
+            await self.send(request)
+        except (websockets.exceptions.ConnectionClosed, ConnectionError):
+            if not can_resend:
+                raise
+            can_resend = False
+            await self._reconnect_and_send(request)
         
         # Stream responses
         while True:
             try:
-                data = await self.receive()
+                try:
+                    data = await self.receive()
+                except (websockets.exceptions.ConnectionClosed, ConnectionError):
+                    if not can_resend:
+                        raise
+                    can_resend = False
+                    await self._reconnect_and_send(request)
+                    continue
+                can_resend = False
                 msg_type = data.get("type")
                 
                 if msg_type == "text":
@@ -165,6 +238,7 @@ class ConnectionManager:
                     yield data
                 
                 elif msg_type == "done":
+                    self._turns += 1
                     yield data
                     break
                 
@@ -1,5 +1,10 @@
 """Default Sudosu agent configuration."""
 
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
+from types import MappingProxyType
+
 DEFAULT_AGENT_NAME = "sudosu"
 
 # Default AGENT.md frontmatter for the user-editable file
@@ -207,13 +212,26 @@ consult_orchestrator(
 Then follow the orchestrator's decision.
 '''
 
-DEFAULT_AGENT_CONFIG = {
+_BASE_AGENT_CONFIG = {
     "name": DEFAULT_AGENT_NAME,
     "description": "The default Sudosu assistant - a powerful all-in-one agent that can connect to Gmail, Calendar, GitHub, Linear, Slack and take actions across all your tools",
     "model": "gemini-2.5-pro",
     "tools": ["read_file", "write_file", "list_directory", "search_files", "run_command", "route_to_agent"],
 }
 
+# Read-only view; get_default_agent_config() merges it into a fresh dict
+DEFAULT_AGENT_CONFIG = MappingProxyType(_BASE_AGENT_CONFIG)
+
+
+# Tool -> capability phrase shown to the router, in display order
+_TOOL_CAPS = (
+    ("write_file", "write/create files"),
+    ("read_file", "read files"),
+    ("run_command", "execute commands"),
+    ("list_directory", "browse directories"),
+    ("search_files", "search files"),
+)
+
 
 def format_agent_for_routing(agent: dict) -> str:
     """
@@ -227,43 +245,30 @@ def format_agent_for_routing(agent: dict) -> str:
     """
     name = agent.get('name', 'unknown')
     description = agent.get('description', 'No description')
-    tools = agent.get('tools', [])
+    tools = agent.get('tools') or ()
     
     # Extract capabilities from tools
-    capabilities = []
-    if 'write_file' in tools:
-        capabilities.append("write/create files")
-    if 'read_file' in tools:
-        capabilities.append("read files")
-    if 'run_command' in tools:
-        capabilities.append("execute commands")
-    if 'list_directory' in tools:
-        capabilities.append("browse directories")
-    if 'search_files' in tools:
-        capabilities.append("search files")
+    capabilities = [cap for tool, cap in _TOOL_CAPS if tool in tools]
     
     # Get summary from system prompt (first meaningful lines)
     system_prompt = agent.get('system_prompt', '')
-    summary_lines = []
-    for line in system_prompt.split('\n'):
-        line = line.strip()
-        if line and not line.startswith('#'):
-            summary_lines.append(line)
-            if len(summary_lines) >= 2:
-                break
+    stripped = (line.strip() for line in system_prompt.splitlines())
+    summary_lines = islice((line for line in stripped if line and not line.startswith('#')), 2)
     summary = ' '.join(summary_lines)[:150]
     if len(summary) == 150:
         summary += '...'
     
     capabilities_str = ', '.join(capabilities) if capabilities else 'basic'
     
-    result = f"### @{name}\n"
-    result += f"**Description**: {description}\n"
-    result += f"**Can**: {capabilities_str}\n"
+    parts = [
+        f"### @{name}",
+        f"**Description**: {description}",
+        f"**Can**: {capabilities_str}",
+    ]
     if summary:
-        result += f"**Focus**: {summary}\n"
+        parts.append(f"**Focus**: {summary}")
     
-    return result
+    return "\n".join(parts) + "\n"
 
 
 def format_user_context_for_prompt(profile: dict) -> str:
@@ -325,51 +330,27 @@ def get_default_agent_config(available_agents: list = None, cwd: str = "", user_
     Returns:
         Complete agent configuration dict
     """
-    config = DEFAULT_AGENT_CONFIG.copy()
-    
-    # Format available agents with detailed info for routing
-    if available_agents:
-        agents_text = "\n".join([
-            format_agent_for_routing(a)
-            for a in available_agents
-        ])
-    else:
-        agents_text = (
-            "*No agents created yet.*\n\n"
-            "When users need specialized help (writing, coding, etc.), "
-            "suggest creating an agent with `/agent create <name>`"
-        )
-    
-    # Get project name from cwd
-    from pathlib import Path
-    project_name = Path(cwd).name if cwd else "Unknown"
-    
-    # Format user context
+    # The built-in prompt is static (it has no per-project placeholders), so
+    # only the user context varies; the assembled prompt is memoized on it.
     user_context = format_user_context_for_prompt(user_profile)
+    return {**_BASE_AGENT_CONFIG, "system_prompt": _build_system_prompt(user_context)}
+
+
+@lru_cache(maxsize=4)
+def _build_system_prompt(user_context: str) -> str:
+    """Splice the user context into the default system prompt."""
+    if not user_context:
+        return DEFAULT_AGENT_SYSTEM_PROMPT
     
-    # Build system prompt with dynamic context
-    base_prompt = DEFAULT_AGENT_SYSTEM_PROMPT.format(
-        available_agents=agents_text,
-        cwd=cwd,
-        project_name=project_name
-    )
-    
-    # Insert user context after the first section if available
-    if user_context:
-        # Insert after "You are Sudosu" intro paragraph
-        insert_point = base_prompt.find("## Your Primary Role")
-        if insert_point > 0:
-            config["system_prompt"] = (
-                base_prompt[:insert_point] + 
-                user_context + "\n\n" + 
-                base_prompt[insert_point:]
-            )
-        else:
-            config["system_prompt"] = user_context + "\n\n" + base_prompt
-    else:
-        config["system_prompt"] = base_prompt
-    
-    return config
+    # Insert after "You are Sudosu" intro paragraph
+    insert_point = DEFAULT_AGENT_SYSTEM_PROMPT.find("## Your Primary Role")
+    if insert_point > 0:
+        return "".join((
+            DEFAULT_AGENT_SYSTEM_PROMPT[:insert_point],
+            user_context, "\n\n",
+            DEFAULT_AGENT_SYSTEM_PROMPT[insert_point:],
+        ))
+    return user_context + "\n\n" + DEFAULT_AGENT_SYSTEM_PROMPT
 
 
 def generate_default_agent_md() -> str:
@@ -382,110 +363,8 @@ def generate_default_agent_md() -> str:
     Returns:
         Content for the AGENT.md file
     """
-    # The prompt includes placeholders that will be filled dynamically at runtime
-    prompt_content = '''# Sudosu - Your Powerful AI Assistant
-
-You are Sudosu, the main AI assistant for this project. You are fully capable of handling ANY task.
-
-## Your Primary Role
-
-You have access to ALL tools and can do everything. However, follow this priority:
-
-1. **FIRST: Check for specialists** - If a specialized agent exists that matches the task, route to them
-2. **THEN: Handle it yourself** - If no specialist exists, YOU handle the task directly with your full capabilities
-
-## 🔌 Cross-Tool Integration Superpowers
-
-You can connect to and take ACTION across multiple tools - not just fetch data, but actually GET WORK DONE:
-
-### Connected Tools & Actions:
-- **Gmail**: Read emails, search inbox, compose & send messages, manage threads
-- **Google Calendar**: Check availability, schedule meetings, create events, send invites
-- **GitHub**: Create issues, review PRs, post comments, manage repositories, check notifications
-- **Linear**: Track tasks, update issue status, prioritize tickets, create new issues
-- **Slack**: Send messages, search conversations, post to channels, manage notifications
-- and lot more
-    
-### Cross-Tool Workflows:
-You can orchestrate complex tasks across multiple tools in a single conversation:
-
-**Examples of what you can do:**
-- "Check P0 issues in Linear, review their GitHub PRs, and email a status update to stakeholders"
-- "Find next week's sprint meetings in Calendar, pull related Linear tickets, and create a sync doc"
-- "Check my GitHub notifications, find PRs needing review, analyze the diffs, and post review comments"
-- "Read my latest emails about the project, update the Linear ticket status, and send a Slack update to the team"
-- "Schedule a meeting with the team in Calendar, create a Linear ticket for follow-up, and send an email with the agenda"
-
-### Integration Guidelines:
-1. **Ask for permission** before taking actions (sending emails, creating tickets, posting messages)
-2. **Draft first, confirm second** - Show what you'll send/create before executing
-3. **Explain your workflow** - Tell the user which tools you'll use and why
-4. **Handle errors gracefully** - If a tool isn't connected, guide the user to connect it
-5. **Be proactive** - Suggest cross-tool workflows when they'd save the user time
-
-### Checking Tool Availability:
-Before using integrations, you can reference `/integrations` to see what's connected.
-If a tool isn't connected, guide the user: "Let's connect Gmail first with `/connect gmail`"
-
-## Routing to Specialized Agents
-
-### ALWAYS Route When:
-- A specialized agent exists that clearly matches the user's task
-- Examples:
-  - "Write a blog post" → route to blog-writer (if exists)
-  - "Create a LinkedIn post" → route to linkedin-writer (if exists)  
-  - "Write a cold email" → route to cold-emailer-agent (if exists)
-  - "Help me with code" → route to coder agent (if exists)
-
-### Handle Directly When:
-- **No specialized agent exists** for the task - YOU do it yourself
-- User is asking questions about the project
-- User wants to know what agents are available
-- User explicitly asks YOU (Sudosu) to handle it
-- Simple file operations or project navigation
-
-## How to Route
-
-When routing, use the `route_to_agent` tool:
-- `agent_name`: The exact name of the agent (e.g., "blog-writer")
-- `message`: The user's original request, optionally refined with context
-
-**IMPORTANT: Call `route_to_agent` only ONCE. After calling it, the routing is complete. 
-Do NOT call it multiple times. Simply confirm to the user that you're handing off to the agent and stop.**
-
-## Your Full Capabilities
-
-You have access to ALL tools and can:
-- ✅ **Read files** to understand project context
-- ✅ **Write and create files** - you CAN write files directly
-- ✅ **List directories** to see project structure  
-- ✅ **Search for files** across the project
-- ✅ **Execute shell commands** - you CAN run commands
-- ✅ **Route tasks** to specialized agents
-- ✅ **Connect to external tools** - Gmail, Calendar, GitHub, Linear, Slack
-- ✅ **Take actions across tools** - send emails, schedule meetings, update tickets, post messages
-- ✅ **Orchestrate workflows** - coordinate complex tasks across multiple tools
-- ✅ **Answer questions** and provide guidance
-
-**You are NOT limited.** If no specialist exists for a task, handle it yourself using your tools.
-
-## Available Commands (for user reference)
-
-- `/help` - Show all available commands
-- `/agent` - List available agents
-- `/agent create <name>` - Create a new agent
-- `/config` - Show configuration
-- `/quit` - Exit Sudosu
-
-## Response Style
-
-1. Be concise and helpful
-2. When routing, explain the handoff briefly
-3. Use markdown formatting
-4. If unsure whether to route, ask the user for clarification
-'''
-    
-    return DEFAULT_AGENT_FRONTMATTER + prompt_content
+    # The file body is the same prompt the built-in default agent uses
+    return DEFAULT_AGENT_FRONTMATTER + DEFAULT_AGENT_SYSTEM_PROMPT
 
 
 def load_default_agent_from_file(cwd: str = "") -> dict | None:
@@ -498,7 +377,6 @@ def load_default_agent_from_file(cwd: str = "") -> dict | None:
     Returns:
         Agent config dict if AGENT.md exists, None otherwise
     """
-    from pathlib import Path
     import frontmatter
     
     cwd_path = Path(cwd) if cwd else Path.cwd()
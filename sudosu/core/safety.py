@@ -1,5 +1,6 @@
 """Safety checks for Sudosu operations."""
 
+import os
 from pathlib import Path
 
 
@@ -10,6 +11,13 @@ COLOR_ACCENT = "#FD7979"
 COLOR_INTERACTIVE = "#BDE3C3"
 
 
+# Resolved once; the checks below only compare strings
+_HOME = os.path.expanduser("~")
+_UNSAFE_DIRS = ("/tmp", "/var", "/etc", "/usr", "/bin", "/sbin", "/opt")
+_UNSAFE_PREFIXES = tuple(d + "/" for d in _UNSAFE_DIRS)
+_UNSAFE_EXACT = frozenset(_UNSAFE_DIRS)
+
+
 def is_safe_directory(cwd: Path = None) -> tuple[bool, str]:
     """
     Check if the current directory is safe for Sudosu operations.
@@ -22,23 +30,23 @@ def is_safe_directory(cwd: Path = None) -> tuple[bool, str]:
     Returns:
         Tuple of (is_safe, reason_if_unsafe)
     """
-    cwd = cwd or Path.cwd()
-    home = Path.home()
+    cwd_str = str(cwd) if cwd else os.getcwd()
     
     # Block home directory
-    if cwd == home:
+    if cwd_str == _HOME:
         return False, "home directory (~)"
     
     # Block root
-    if cwd == Path("/"):
+    if cwd_str == "/":
         return False, "root directory (/)"
     
     # Block common system directories
-    unsafe_paths = ["/tmp", "/var", "/etc", "/usr", "/bin", "/sbin", "/opt"]
-    cwd_str = str(cwd)
-    for unsafe in unsafe_paths:
-        if cwd_str == unsafe or cwd_str.startswith(unsafe + "/"):
-            return False, f"system directory ({unsafe})"
+    if cwd_str in _UNSAFE_EXACT:
+        return False, f"system directory ({cwd_str})"
+    if cwd_str.startswith(_UNSAFE_PREFIXES):
+        # Every unsafe dir is a single top-level component, so the match is
+        # just the first path segment
+        return False, f"system directory ({cwd_str[:cwd_str.index('/', 1)]})"
     
     return True, ""
 
@@ -71,5 +79,4 @@ or cause unintended modifications.
 
 def is_home_directory(cwd: Path = None) -> bool:
     """Check if the current directory is the home directory."""
-    cwd = cwd or Path.cwd()
-    return cwd == Path.home()
+    return (str(cwd) if cwd else os.getcwd()) == _HOME
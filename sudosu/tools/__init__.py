@@ -1,5 +1,6 @@
 """Local tool execution for Sudosu client."""
 
+import asyncio
 import fnmatch
 import os
 import subprocess
@@ -292,7 +293,10 @@ async def tool_run_command(args: dict, cwd: str) -> dict:
             }
     
     try:
-        result = subprocess.run(
+        # Run in a worker thread so the event loop (and the backend
+        # WebSocket) stays responsive while the command executes
+        result = await asyncio.to_thread(
+            subprocess.run,
             command,
             shell=True,
             capture_output=True,
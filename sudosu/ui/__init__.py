@@ -1,20 +1,26 @@
 """Console UI helpers for Sudosu."""
 
+import asyncio
+import re
+import time
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from prompt_toolkit import PromptSession
 from prompt_toolkit.formatted_text import HTML
 from prompt_toolkit.history import FileHistory
-from rich.console import Console
-from rich.live import Live
-from rich.markdown import Markdown
-from rich.markup import escape
+from rich.console import Console, Group, NewLine
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.syntax import Syntax
 from rich.table import Table
 from rich.text import Text
 
+# rich.markdown, rich.live, rich.progress and rich.syntax (which pulls in
+# Pygments) are imported where they're used, keeping `import sudosu.ui` cheap
+if TYPE_CHECKING:
+    from rich.live import Live
+    from rich.markdown import Markdown
+
 
 console = Console()
 
@@ -84,6 +90,7 @@ SUDOSU_LOGO_SIMPLE = """
 """
 
 
+@lru_cache(maxsize=1)
 def get_version() -> str:
     """Get Sudosu version."""
     try:
@@ -93,10 +100,25 @@ def get_version() -> str:
         return "0.1.0"
 
 
+@lru_cache(maxsize=1)
+def _welcome_tips() -> Text:
+    """Build the static right-hand side of the welcome box (tips and activity)."""
+    right_content = Text()
+    right_content.append("Tips for getting started\n", style=f"bold {COLOR_SECONDARY}")  # Secondary for headings
+    right_content.append("Type a message to chat with your AI agent\n", style="white")
+    right_content.append("Use ", style="white")
+    right_content.append("@agent_name", style=f"{COLOR_INTERACTIVE}")  # Interactive color for commands
+    right_content.append(" to switch agents\n", style="white")
+    right_content.append("Type ", style="white")
+    right_content.append("/help", style=f"{COLOR_INTERACTIVE}")
+    right_content.append(" for all commands\n\n", style="white")
+    right_content.append("Recent activity\n", style=f"bold {COLOR_SECONDARY}")
+    right_content.append("No recent activity", style="dim")
+    return right_content
+
+
 def print_welcome(username: str = "User"):
     """Print welcome message with ASCII art logo - Claude Code style."""
-    console.print()
-    
     # Create the welcome box similar to Claude Code
     version = get_version()
     
@@ -111,20 +133,7 @@ def print_welcome(username: str = "User"):
     left_content.append(SUDOSU_LOGO_SIMPLE, style=f"bold {COLOR_PRIMARY}")  # Primary color for logo
     left_content.append(f"\nv{version}", style="dim")
     
-    # Build right side content (tips and recent activity)
-    right_content = Text()
-    right_content.append("Tips for getting started\n", style=f"bold {COLOR_SECONDARY}")  # Secondary for headings
-    right_content.append("Type a message to chat with your AI agent\n", style="white")
-    right_content.append("Use ", style="white")
-    right_content.append("@agent_name", style=f"{COLOR_INTERACTIVE}")  # Interactive color for commands
-    right_content.append(" to switch agents\n", style="white")
-    right_content.append("Type ", style="white")
-    right_content.append("/help", style=f"{COLOR_INTERACTIVE}")
-    right_content.append(" for all commands\n\n", style="white")
-    right_content.append("Recent activity\n", style=f"bold {COLOR_SECONDARY}")
-    right_content.append("No recent activity", style="dim")
-    
-    layout_table.add_row(left_content, right_content)
+    layout_table.add_row(left_content, _welcome_tips())
     
     # Wrap in a panel with the title
     panel = Panel(
@@ -135,52 +144,62 @@ def print_welcome(username: str = "User"):
         padding=(1, 2),
     )
     
-    console.print(panel)
-    console.print()
-
-
-def print_help():
-    """Print help message."""
+    # One write for the blank lines and the box
+    console.print(Group(NewLine(), panel, NewLine()))
+
+
+_HELP_COMMANDS = (
+    ("/help", "Show this help message"),
+    ("/agent", "List available agents"),
+    ("/agent create <name>", "Create a new agent"),
+    ("/agent delete <name>", "Delete an agent"),
+    ("/memory", "Show conversation memory info"),
+    ("/memory clear", "Clear conversation (fresh start)"),
+    ("/back", "Return to sudosu from an agent"),
+    ("/profile", "View your profile"),
+    ("/profile edit", "Update your profile"),
+    ("/config", "Show current configuration"),
+    ("/config set <key> <value>", "Set a configuration value"),
+    ("/clear", "Clear the screen"),
+    ("/quit", "Exit Sudosu"),
+    ("", ""),
+    ("-- Background Tasks --", ""),
+    ("/tasks", "List your background tasks"),
+    ("/tasks status <id>", "Get task status"),
+    ("/tasks logs <id>", "View task execution logs"),
+    ("/tasks cancel <id>", "Cancel a running task"),
+    ("/tasks watch <id>", "Watch task progress live"),
+    ("", ""),
+    ("-- Integrations --", ""),
+    ("/connect gmail", "Connect your Gmail account"),
+    ("/disconnect gmail", "Disconnect Gmail"),
+    ("/integrations", "Show connected integrations"),
+    ("", ""),
+    ("@<agent> <message>", "Switch to and message an agent"),
+    ("<message>", "Continue with current agent"),
+)
+
+
+@lru_cache(maxsize=1)
+def _help_output() -> Group:
+    """Build the /help table and tip once; they never change at runtime."""
     table = Table(title="Sudosu Commands", border_style=COLOR_PRIMARY, title_style=f"bold {COLOR_PRIMARY}")
     table.add_column("Command", style=COLOR_INTERACTIVE)
     table.add_column("Description")
     
-    commands = [
-        ("/help", "Show this help message"),
-        ("/agent", "List available agents"),
-        ("/agent create <name>", "Create a new agent"),
-        ("/agent delete <name>", "Delete an agent"),
-        ("/memory", "Show conversation memory info"),
-        ("/memory clear", "Clear conversation (fresh start)"),
-        ("/back", "Return to sudosu from an agent"),
-        ("/profile", "View your profile"),
-        ("/profile edit", "Update your profile"),
-        ("/config", "Show current configuration"),
-        ("/config set <key> <value>", "Set a configuration value"),
-        ("/clear", "Clear the screen"),
-        ("/quit", "Exit Sudosu"),
-        ("", ""),
-        ("-- Background Tasks --", ""),
-        ("/tasks", "List your background tasks"),
-        ("/tasks status <id>", "Get task status"),
-        ("/tasks logs <id>", "View task execution logs"),
-        ("/tasks cancel <id>", "Cancel a running task"),
-        ("/tasks watch <id>", "Watch task progress live"),
-        ("", ""),
-        ("-- Integrations --", ""),
-        ("/connect gmail", "Connect your Gmail account"),
-        ("/disconnect gmail", "Disconnect Gmail"),
-        ("/integrations", "Show connected integrations"),
-        ("", ""),
-        ("@<agent> <message>", "Switch to and message an agent"),
-        ("<message>", "Continue with current agent"),
-    ]
-    
-    for cmd, desc in commands:
+    for cmd, desc in _HELP_COMMANDS:
         table.add_row(cmd, desc)
     
-    console.print(table)
-    console.print(f"\n[dim]Tip: After sudosu routes you to an agent,\n   your follow-ups go to that agent automatically.[/dim]")
+    tip = Text(
+        "\nTip: After sudosu routes you to an agent,\n   your follow-ups go to that agent automatically.",
+        style="dim",
+    )
+    return Group(table, tip)
+
+
+def print_help():
+    """Print help message."""
+    console.print(_help_output())
 
 
 def print_agents(agents: list[dict]):
@@ -207,24 +226,43 @@ def print_agents(agents: list[dict]):
     console.print("\n[dim]Agents are stored in .sudosu/agents/ | Default prompt in .sudosu/AGENT.md[/dim]")
 
 
+# Fixed message prefixes, styled once; messages are appended as plain Text so
+# no markup is parsed per call (and user text can't inject any)
+_ERROR_PREFIX = Text.assemble(("Error:", f"bold {COLOR_ACCENT}"), " ")
+_SUCCESS_PREFIX = Text.assemble(("✓", f"bold {COLOR_INTERACTIVE}"), " ")
+_WARNING_PREFIX = Text.assemble(("⚠", f"bold {COLOR_ACCENT}"), " ")
+_INFO_PREFIX = Text.assemble(("ℹ", f"bold {COLOR_INTERACTIVE}"), " ")
+
+
+def _highlight(text: Text) -> Text:
+    """Apply the repr highlighting (paths, numbers, "...") Rich gives printed
+    strings but not Text, layered under text's own styles like markup is."""
+    highlighted = console.highlighter(Text(text.plain, style=text.style, end=text.end))
+    highlighted.copy_styles(text)
+    return highlighted
+
+
+_THINKING = _highlight(Text.assemble("\n", ("thinking...", f"bold {COLOR_PRIMARY}"), "\n"))
+
+
 def print_error(message: str):
     """Print error message."""
-    console.print(f"[bold {COLOR_ACCENT}]Error:[/bold {COLOR_ACCENT}] {escape(message)}", highlight=False)
+    console.print(_ERROR_PREFIX + Text(message), highlight=False)
 
 
 def print_success(message: str):
     """Print success message."""
-    console.print(f"[bold {COLOR_INTERACTIVE}]✓[/bold {COLOR_INTERACTIVE}] {escape(message)}", highlight=False)
+    console.print(_SUCCESS_PREFIX + Text(message), highlight=False)
 
 
 def print_warning(message: str):
     """Print warning message."""
-    console.print(f"[bold {COLOR_ACCENT}]⚠[/bold {COLOR_ACCENT}] {escape(message)}", highlight=False)
+    console.print(_WARNING_PREFIX + Text(message), highlight=False)
 
 
 def print_info(message: str):
     """Print info message."""
-    console.print(f"[bold {COLOR_INTERACTIVE}]ℹ[/bold {COLOR_INTERACTIVE}] {escape(message)}", highlight=False)
+    console.print(_INFO_PREFIX + Text(message), highlight=False)
 
 
 def print_agent_thinking(agent_name: str):
@@ -234,70 +272,148 @@ def print_agent_thinking(agent_name: str):
     For other agents, shows '@agent_name thinking...'
     """
     if agent_name.lower() == "sudosu":
-        console.print(f"\n[bold {COLOR_PRIMARY}]thinking...[/bold {COLOR_PRIMARY}]\n")
+        console.print(_THINKING)
     else:
-        console.print(f"\n[bold {COLOR_PRIMARY}]@{agent_name}[/bold {COLOR_PRIMARY}] is thinking...\n")
+        console.print(_highlight(Text.assemble(
+            "\n", (f"@{agent_name}", f"bold {COLOR_PRIMARY}"), " is thinking...\n",
+        )))
 
 
 def print_routing_to_agent(agent_name: str):
     """Print routing transition message."""
-    console.print(f"\n[bold {COLOR_INTERACTIVE}]→ Routing to @{agent_name}...[/bold {COLOR_INTERACTIVE}]\n")
+    console.print(_highlight(Text.assemble(
+        "\n", (f"→ Routing to @{agent_name}...", f"bold {COLOR_INTERACTIVE}"), "\n",
+    )))
 
 
 def print_consultation_route(from_agent: str, to_agent: str, reason: str):
     """Print consultation routing message."""
-    console.print(f"\n[dim]💭 @{from_agent} consulted the orchestrator...[/dim]")
-    console.print(f"[bold {COLOR_INTERACTIVE}]→ Handing off to @{to_agent}[/bold {COLOR_INTERACTIVE}]")
-    console.print(f"[dim]   Reason: {reason}[/dim]\n")
+    console.print(_highlight(Text.assemble(
+        "\n",
+        (f"💭 @{from_agent} consulted the orchestrator...", "dim"), "\n",
+        (f"→ Handing off to @{to_agent}", f"bold {COLOR_INTERACTIVE}"), "\n",
+        (f"   Reason: {reason}", "dim"), "\n",
+    )))
+
+
+# Per-tool status lines, looked up by tool name: the styled text around the
+# argument is built once, and the argument is appended as plain Text (then
+# highlighted like the old markup strings were)
+_TOOL_EXECUTION_MESSAGES = {
+    "write_file": (Text("📝 Writing to ", style="dim"), "path", "file", Text("...", style="dim")),
+    "read_file": (Text("📖 Reading ", style="dim"), "path", "file", Text("...", style="dim")),
+    "list_directory": (Text("📁 Listing ", style="dim"), "path", ".", Text("...", style="dim")),
+    "run_command": (Text("⚡ Running: ", style="dim"), "command", "command", Text("", style="dim")),
+}
+_TOOL_EXECUTING = (Text("🔧 Executing ", style="dim"), Text("...", style="dim"))
+
+# Success messages for tools whose results are worth showing, as
+# (prefix, result key, default); the others' output (file contents,
+# listings) goes to the agent only
+_TOOL_RESULT_MESSAGES = {
+    "write_file": (Text("✓ File saved: ", style=COLOR_INTERACTIVE), "path", "unknown"),
+}
+_TOOL_FAILED = Text("✗ ", style=COLOR_ACCENT)
 
 
 def print_tool_execution(tool_name: str, args: dict):
     """Print tool execution info."""
-    if tool_name == "write_file":
-        path = args.get("path", "file")
-        console.print(f"[dim]📝 Writing to {path}...[/dim]")
-    elif tool_name == "read_file":
-        path = args.get("path", "file")
-        console.print(f"[dim]📖 Reading {path}...[/dim]")
-    elif tool_name == "list_directory":
-        path = args.get("path", ".")
-        console.print(f"[dim]📁 Listing {path}...[/dim]")
-    elif tool_name == "run_command":
-        cmd = args.get("command", "command")
-        console.print(f"[dim]⚡ Running: {cmd}[/dim]")
+    message = _TOOL_EXECUTION_MESSAGES.get(tool_name)
+    if message:
+        prefix, key, default, suffix = message
+        console.print(_highlight(prefix + Text(str(args.get(key, default)), style="dim") + suffix))
     else:
-        console.print(f"[dim]🔧 Executing {tool_name}...[/dim]")
+        prefix, suffix = _TOOL_EXECUTING
+        console.print(_highlight(prefix + Text(tool_name, style="dim") + suffix))
 
 
 def print_tool_result(tool_name: str, result: dict):
     """Print tool execution result."""
     if result.get("success"):
-        if tool_name == "write_file":
-            console.print(f"[{COLOR_INTERACTIVE}]✓ File saved: {result.get('path', 'unknown')}[/{COLOR_INTERACTIVE}]")
-        elif tool_name == "read_file":
-            # Don't print content, it goes to the agent
-            pass
-        elif tool_name == "list_directory":
-            # Don't print listing, it goes to the agent
-            pass
+        message = _TOOL_RESULT_MESSAGES.get(tool_name)
+        if message:
+            prefix, key, default = message
+            value = Text(str(result.get(key, default)), style=prefix.style)
+            console.print(_highlight(prefix + value))
     elif "error" in result:
-        console.print(f"[{COLOR_ACCENT}]✗ {result['error']}[/{COLOR_ACCENT}]")
+        console.print(_highlight(_TOOL_FAILED + Text(str(result["error"]), style=COLOR_ACCENT)))
+
+
+# Largest document kept in the parsed-markdown cache
+_MD_CACHE_MAX_CHARS = 4096
+
+
+@lru_cache(maxsize=64)
+def _cached_markdown(content: str) -> "Markdown":
+    from rich.markdown import Markdown
+    
+    return Markdown(content)
+
+
+# Anything that could make Markdown render differently from the raw text:
+# inline markers, escapes/HTML, line structure, leading indentation, list
+# item starts (including empty items like a lone "-" or "1.") and lines made
+# only of - / = (thematic breaks such as "---" or "- - -", setext underlines)
+_MD_SYNTAX_RE = re.compile(
+    r"[#*`|\[\]>_~<&\\\n]"
+    r"|^[ \t]"
+    r"|^[-+](?:\s|$)"
+    r"|^\d+[.)](?:\s|$)"
+    r"|^[-=][-= \t]*$"
+)
+
+
+def _markdown(content: str) -> "Markdown | Text":
+    """Parse markdown, reusing the parse for repeated (short) documents.
+    
+    A single line with none of the syntax above (e.g. a short plain reply)
+    skips the parser and is returned as plain Text with trailing whitespace
+    stripped: the same visible text Markdown would produce, without
+    Markdown's padding of the line to the console width.
+    """
+    if not _MD_SYNTAX_RE.search(content):
+        return Text(content.rstrip())
+    if len(content) > _MD_CACHE_MAX_CHARS:
+        from rich.markdown import Markdown
+        
+        return Markdown(content)
+    return _cached_markdown(content)
 
 
 def print_markdown(content: str):
     """Print markdown content."""
-    md = Markdown(content)
-    console.print(md)
+    console.print(_markdown(content))
+
+
+@lru_cache(maxsize=16)
+def _lexer_for(language: str):
+    """Resolve a Pygments lexer once per language (None if unknown).
+    
+    Options match what rich.syntax.Syntax uses when given a lexer name.
+    """
+    from pygments.lexers import get_lexer_by_name
+    from pygments.util import ClassNotFound
+    
+    try:
+        return get_lexer_by_name(language, stripnl=False, ensurenl=True, tabsize=4)
+    except ClassNotFound:
+        return None
 
 
 def print_code(code: str, language: str = "python"):
     """Print syntax-highlighted code."""
-    syntax = Syntax(code, language, theme="monokai", line_numbers=True)
+    from rich.syntax import Syntax
+    
+    # Unknown languages keep the name so Syntax falls back to plain text
+    lexer = _lexer_for(language) or language
+    syntax = Syntax(code, lexer, theme="monokai", line_numbers=True)
     console.print(syntax)
 
 
 def create_spinner(message: str = "Processing..."):
     """Create a spinner progress indicator."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    
     return Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -306,20 +422,58 @@ def create_spinner(message: str = "Processing..."):
     )
 
 
+# Raw stream echo is written in batches: once this many characters are
+# pending, or when the previous write is older than the interval. Text queued
+# inside the interval is written by a one-off timer, so it still shows up when
+# the stream pauses (e.g. while the model writes a long tool argument)
+_RAW_BATCH_CHARS = 64
+_RAW_BATCH_INTERVAL = 0.016
+
+
+def _call_later(delay: float, callback):
+    """Schedule callback on the running event loop; None when there isn't one."""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+    return loop.call_later(delay, callback)
+
+
 class StreamPrinter:
     """Handles streaming text output with markdown rendering support.
     
     Modes:
     - render_markdown=True, show_streaming=False: Buffer all, render markdown at end (cleanest)
-    - render_markdown=True, show_streaming=True: Show raw stream then render markdown (redundant but shows activity)
+    - render_markdown=True, show_streaming=True: Show a spinner while streaming, then
+      render markdown (legacy_echo=True instead echoes the raw stream first, then
+      renders it again)
     - render_markdown=False: Print raw text as it streams (no formatting)
     """
     
-    def __init__(self, render_markdown: bool = True, show_streaming: bool = False):
-        self.buffer = ""
+    def __init__(
+        self,
+        render_markdown: bool = True,
+        show_streaming: bool = False,
+        legacy_echo: bool = False,
+    ):
+        # Chunks are collected in lists and joined only when rendered, so a
+        # long stream costs O(n) rather than one string copy per chunk
+        self._parts: list[str] = []
         self.render_markdown = render_markdown
         self.show_streaming = show_streaming
+        self.legacy_echo = legacy_echo
+        self._spinner = None
         self._chunk_count = 0
+        self._raw_parts: list[str] = []
+        self._raw_len = 0
+        self._raw_style = None
+        self._raw_last = 0.0
+        self._raw_timer: "asyncio.TimerHandle | None" = None
+    
+    @property
+    def buffer(self) -> str:
+        """The text buffered for the final markdown render."""
+        return "".join(self._parts)
     
     def print_chunk(self, chunk: str):
         """Print a chunk of streaming text."""
@@ -327,68 +481,225 @@ class StreamPrinter:
         
         if self.render_markdown:
             # Buffer for final markdown rendering
-            self.buffer += chunk
+            self._parts.append(chunk)
             
             if self.show_streaming:
-                # Also show raw text as it streams (dimmed)
-                console.print(chunk, end="", style="dim")
+                if self.legacy_echo:
+                    # Also show raw text as it streams (dimmed)
+                    self._write_raw(chunk, "dim")
+                elif self._spinner is None and console.is_terminal:
+                    # Show activity without printing the response twice
+                    self._spinner = create_spinner()
+                    self._spinner.add_task("Streaming...", total=None)
+                    self._spinner.start()
         else:
             # Raw mode: print directly without markdown processing
-            console.print(chunk, end="")
+            self._write_raw(chunk, None)
+    
+    def _write_raw(self, chunk: str, style: str | None):
+        """Queue raw text, writing it out once a batch is due."""
+        self._raw_parts.append(chunk)
+        self._raw_len += len(chunk)
+        self._raw_style = style
+        now = time.monotonic()
+        elapsed = now - self._raw_last
+        if self._raw_len >= _RAW_BATCH_CHARS or elapsed > _RAW_BATCH_INTERVAL:
+            self._flush_raw(now)
+        elif self._raw_timer is None:
+            # Nothing else may arrive for a while; write this batch when due
+            self._raw_timer = _call_later(_RAW_BATCH_INTERVAL - elapsed, self._flush_raw)
+    
+    def _flush_raw(self, now: float | None = None):
+        """Write out any queued raw text."""
+        if self._raw_timer is not None:
+            self._raw_timer.cancel()
+            self._raw_timer = None
+        if self._raw_parts:
+            console.print("".join(self._raw_parts), end="", style=self._raw_style, markup=False)
+            self._raw_parts.clear()
+            self._raw_len = 0
+        self._raw_last = time.monotonic() if now is None else now
+    
+    def show_pending(self):
+        """Write out queued raw text, e.g. before printing a tool status line."""
+        self._flush_raw()
     
     def flush(self):
         """Flush buffer and render as markdown."""
-        if self.buffer:
+        self._flush_raw()
+        if self._spinner is not None:
+            self._spinner.stop()
+            self._spinner = None
+        text = self.buffer
+        if text:
             if self.render_markdown:
-                if self.show_streaming:
+                if self.show_streaming and self.legacy_echo:
                     # Add visual separator before formatted version
                     console.print("\n")
                     console.rule(style="dim blue")
                     console.print()
                 
                 # Render the complete response as formatted markdown
-                md = Markdown(self.buffer.strip())
-                console.print(md)
+                console.print(_markdown(text.strip()))
             else:
                 # Just ensure newline at end for raw mode
                 pass
-            self.buffer = ""
+            self._parts.clear()
         console.print()  # Final newline
 
 
+# Streamed markdown is segmented at blank lines; fence lines toggle whether a
+# blank line actually ends a block
+_BLOCK_BREAK_RE = re.compile(r"\n\n+")
+_FENCE_RE = re.compile(r"^[ \t]*(?:```|~~~)", re.M)
+
+
+def _split_settled(text: str) -> tuple[list[str], str]:
+    """Split streamed markdown into finished blocks and the still-open tail.
+    
+    Blocks end at a blank line, except inside a fenced code block, which may
+    itself contain blank lines; an unterminated fence stays in the tail.
+    """
+    blocks = []
+    start = pos = 0
+    in_fence = False
+    for match in _BLOCK_BREAK_RE.finditer(text):
+        if len(_FENCE_RE.findall(text, pos, match.start())) % 2:
+            in_fence = not in_fence
+        pos = match.end()
+        if not in_fence:
+            block = text[start:match.start()]
+            if block.strip():
+                blocks.append(block)
+            start = pos
+    return blocks, text[start:]
+
+
 class LiveStreamPrinter:
     """Streams text with live-updating markdown rendering.
     
     Uses Rich's Live display to progressively render markdown as chunks arrive.
     Provides the best experience: see formatted output as it streams.
+    
+    Chunks are coalesced: the display is re-rendered at most once every
+    ``min_interval`` seconds, with a trailing redraw so text held back by the
+    throttle still appears when the stream pauses. Blocks that are finished
+    (ended by a blank line) are parsed once and kept; each update only
+    re-parses the open tail. The final frame is rendered from the whole
+    response so the output matches a one-shot render exactly.
+    
+    When stdout isn't a terminal (piped, CI) there is nothing to update in
+    place, so no Live display is started and the response is rendered once
+    on flush.
     """
     
-    def __init__(self):
-        self.buffer = ""
-        self._live: Live | None = None
+    def __init__(self, min_interval: float = 0.05):
+        # Whole response and not-yet-rendered chunks, joined only on update
+        self._parts: list[str] = []
+        self._pending: list[str] = []
+        self._live: "Live | None" = None
+        self._tty = console.is_terminal
+        self._buffered = False
+        self._min_interval = min_interval
+        self._last_update = 0.0
+        self._dirty = False
+        self._redraw: "asyncio.TimerHandle | None" = None
+        self._stable_blocks: list = []
+        self._tail = ""
+    
+    @property
+    def buffer(self) -> str:
+        """The full text received so far."""
+        return "".join(self._parts)
     
     def start(self):
         """Start live display."""
+        if not self._tty:
+            self._buffered = True
+            return
+        
+        from rich.live import Live
+        
+        # Shared empty placeholder (parsed once, via the markdown cache)
         self._live = Live(
-            Markdown(""),
+            _cached_markdown(""),
             console=console,
-            refresh_per_second=10,
+            # Redrawn only when content changes (see _update), so there's no
+            # background refresh thread waking up while the model is idle
+            auto_refresh=False,
             vertical_overflow="visible",
         )
         self._live.start()
     
     def print_chunk(self, chunk: str):
         """Add chunk and update live markdown display."""
-        self.buffer += chunk
+        self._parts.append(chunk)
         if self._live:
-            # Re-render markdown with updated content
-            self._live.update(Markdown(self.buffer))
+            self._pending.append(chunk)
+            self._dirty = True
+            now = time.monotonic()
+            elapsed = now - self._last_update
+            if elapsed < self._min_interval:
+                if self._redraw is None:
+                    self._redraw = _call_later(self._min_interval - elapsed, self.show_pending)
+                return
+            self._update(now)
+    
+    def _update(self, now: float):
+        """Re-render the display: settled blocks as-is, the tail re-parsed."""
+        from rich.markdown import Markdown
+        
+        self._cancel_redraw()
+        self._tail += "".join(self._pending)
+        self._pending.clear()
+        blocks, self._tail = _split_settled(self._tail)
+        for block in blocks:
+            if self._stable_blocks:
+                self._stable_blocks.append(NewLine())
+            self._stable_blocks.append(Markdown(block))
+        
+        if self._stable_blocks and self._tail.strip():
+            renderable = Group(*self._stable_blocks, NewLine(), Markdown(self._tail))
+        elif self._stable_blocks:
+            renderable = Group(*self._stable_blocks)
+        else:
+            renderable = Markdown(self._tail)
+        self._live.update(renderable, refresh=True)
+        self._last_update = now
+        self._dirty = False
+    
+    def show_pending(self):
+        """Draw text held back by the throttle, e.g. before a tool status line."""
+        self._cancel_redraw()
+        if self._live and self._dirty:
+            self._update(time.monotonic())
+    
+    def _cancel_redraw(self):
+        """Drop the scheduled trailing redraw, if any."""
+        if self._redraw is not None:
+            self._redraw.cancel()
+            self._redraw = None
     
     def flush(self):
         """Stop live display and print final output."""
+        self._cancel_redraw()
         if self._live:
+            # Final frame from the full response (one parse), so block
+            # segmentation never affects what stays on screen
+            if self._dirty or self._stable_blocks:
+                from rich.markdown import Markdown
+                
+                self._live.update(Markdown(self.buffer), refresh=True)
             self._live.stop()
             self._live = None
+        elif self._buffered:
+            text = self.buffer
+            if text:
+                console.print(_markdown(text))
+            self._buffered = False
+        self._stable_blocks = []
+        self._pending.clear()
+        self._tail = ""
         console.print()  # Final newline
     
     def __enter__(self):
@@ -399,6 +710,14 @@ class LiveStreamPrinter:
         self.flush()
 
 
+@lru_cache(maxsize=8)
+def _styled_prompt(prompt: str) -> HTML:
+    """Build the colored input prompt (shared by the sync and async readers)."""
+    # Use prompt_toolkit's HTML formatting for proper color support
+    # COLOR_PRIMARY is #FEEAC9 (warm cream)
+    return HTML(f'<style fg="#FEEAC9" bold="true">{prompt}</style>')
+
+
 def get_user_input(prompt: str = "> ") -> str:
     """Get user input with styled prompt and command history.
     
@@ -410,9 +729,7 @@ def get_user_input(prompt: str = "> ") -> str:
     Note: This is a sync wrapper. For async contexts, use get_user_input_async().
     """
     session = _get_prompt_session()
-    # Use prompt_toolkit's HTML formatting for proper color support
-    # COLOR_PRIMARY is #FEEAC9 (warm cream)
-    styled_prompt = HTML(f'<style fg="#FEEAC9" bold="true">{prompt}</style>')
+    styled_prompt = _styled_prompt(prompt)
     
     # Check if we're in an async context
     import asyncio
@@ -434,16 +751,21 @@ async def get_user_input_async(prompt: str = "> ") -> str:
     Use this in async contexts (like the main interactive loop).
     """
     session = _get_prompt_session()
-    # Use prompt_toolkit's HTML formatting for proper color support
-    # COLOR_PRIMARY is #FEEAC9 (warm cream)
-    styled_prompt = HTML(f'<style fg="#FEEAC9" bold="true">{prompt}</style>')
+    styled_prompt = _styled_prompt(prompt)
     return await session.prompt_async(styled_prompt)
 
 
+# Answers accepted as "yes" by get_user_confirmation (compared casefolded)
+_YES: frozenset[str] = frozenset({"y", "yes"})
+
+
 def get_user_confirmation(message: str) -> bool:
-    """Get yes/no confirmation from user."""
-    response = console.input(f"{message} [y/N]: ").strip().lower()
-    return response in ("y", "yes")
+    """Get yes/no confirmation from user.
+    
+    Only an English "y"/"yes" (any case) confirms; anything else, including
+    an empty answer, means no.
+    """
+    return console.input(f"{message} [y/N]: ").strip().casefold() in _YES
 
 
 def clear_screen():